@@ -68,16 +68,11 @@ st.markdown("""
 # =============================================================================
 # DATA LOADING WITH CACHING
 # =============================================================================
-# @st.cache_data is a decorator that caches the function's return value
+# load_all_data() is already decorated with @st.cache_data in utils/data_loader.py
 # This means the data is only loaded once from CSV files, then stored in memory
-# Subsequent calls to get_data() return the cached data instantly - huge performance boost!
-@st.cache_data
-def get_data():
-    return load_all_data()
-
-# Actually call the function to get our data dictionary
-# The data variable now holds all our CSVs as pandas DataFrames
-data = get_data()
+# Every page calls the same cached function, so they all share one cache entry
+# instead of each page keeping its own extra copy of every DataFrame
+data = load_all_data()
 
 # =============================================================================
 # SIDEBAR FILTERS
@@ -128,14 +123,8 @@ filtered_medals = data['medals_total'].copy()
 filtered_events = data['events'].copy()
 filtered_athletes = data['athletes'].copy()
 
-# Merge medals with NOCs (National Olympic Committees) to get continent information
-# .merge() is like a SQL JOIN - it combines two DataFrames based on matching columns
-# left_on and right_on specify which columns to match between the two DataFrames
-# how='left' keeps all rows from the left DataFrame, even if no match is found
-filtered_medals = filtered_medals.merge(data['nocs'][['code', 'continent']], 
-                                       left_on='country_code', 
-                                       right_on='code', 
-                                       how='left')
+# Note: medals_total and athletes already have a 'continent' column
+# (load_all_data() adds it from the NOCs table), so there's nothing to merge here
 
 # Apply country filter if the user has selected any countries
 # filters['countries'] will be an empty list if nothing is selected
@@ -148,11 +137,6 @@ if filters['countries']:
 # Apply continent filter similarly
 if filters['continents']:
     filtered_medals = filtered_medals[filtered_medals['continent'].isin(filters['continents'])]
-    # For athletes, we need to first add continent info by merging with NOCs
-    filtered_athletes = filtered_athletes.merge(data['nocs'][['code', 'continent']], 
-                                                left_on='country_code', 
-                                                right_on='code', 
-                                                how='left')
     filtered_athletes = filtered_athletes[filtered_athletes['continent'].isin(filters['continents'])]
 
 # Apply sport filter to events
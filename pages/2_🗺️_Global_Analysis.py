@@ -23,7 +23,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.data_loader import load_all_data
 from utils.filters import create_sidebar_filters, get_filter_summary
-from utils.ioc_iso_mapping import get_iso_code  # Converts IOC country codes to ISO codes for maps
+from utils.ioc_iso_mapping import to_iso_series  # Converts IOC country codes to ISO codes for maps
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -42,11 +42,7 @@ st.set_page_config(
 # Using the same caching pattern as the main page
 # Even though we load data on every page, caching means it's only actually
 # loaded from disk once - all pages share the same cached data
-@st.cache_data
-def get_data():
-    return load_all_data()
-
-data = get_data()
+data = load_all_data()
 
 # Create sidebar filters - this function handles all the UI widgets
 # and returns a dictionary with the user's selections
@@ -71,18 +67,9 @@ st.markdown("---")
 # PREPARE MEDALS DATA WITH CONTINENT INFORMATION
 # =============================================================================
 # Start with a copy of the medal totals by country
+# The 'continent' column is already there - load_all_data() adds it from the NOCs table
 medals_df = data['medals_total'].copy()
 
-# Merge with NOCs data to add continent information to each country
-# We're selecting only the 'code' and 'continent' columns from nocs
-# The merge joins on country_code (left) matching code (right)
-medals_df = medals_df.merge(
-    data['nocs'][['code', 'continent']], 
-    left_on='country_code', 
-    right_on='code', 
-    how='left'  # Keep all rows from medals_df even if no NOC match
-)
-
 # =============================================================================
 # APPLY USER FILTERS
 # =============================================================================
@@ -98,9 +85,9 @@ medals_df['total_medals'] = medals_df['Gold Medal'] + medals_df['Silver Medal']
 #this is a new cell in the medals df dataframe
 # Add ISO codes for the map - Plotly maps use ISO-3 country codes
 # Our data uses IOC codes (like 'USA', 'GBR') which are similar but not identical
-# The get_iso_code function converts them (e.g., 'GER' -> 'DEU')
-medals_df['iso_code'] = medals_df['country_code'].apply(get_iso_code)
-#getting a new cell form the country code by appluing the get iso code from country code
+# The to_iso_series function converts the whole column at once (e.g., 'GER' -> 'DEU')
+medals_df['iso_code'] = to_iso_series(medals_df['country_code'])
+#getting a new cell form the country code by converting the whole country code column
 # =============================================================================
 # SECTION 1: WORLD MEDAL MAP (CHOROPLETH)
 # =============================================================================
@@ -149,17 +136,9 @@ st.header("☀️ Medal Hierarchy: Continent → Country → Discipline")
 st.markdown("Drill down from continent to country to discipline to see medal distributions")
 
 # For this visualization, we need the detailed medals data (each medal awarded)
-# rather than the aggregated totals
+# rather than the aggregated totals (it already has a 'continent' column too)
 medals_detail = data['medals'].copy()
 
-# Add continent information by merging with NOCs
-medals_detail = medals_detail.merge(
-    data['nocs'][['code', 'continent']],
-    left_on='country_code',
-    right_on='code',
-    how='left'
-)
-
 # Apply all the user's filters to this dataset too
 if filters['countries']:
     medals_detail = medals_detail[medals_detail['country_code'].isin(filters['countries'])]
@@ -325,13 +304,14 @@ col1, col2, col3 ,col4 = st.columns(4)
 
 with col1:
     # Find the continent with the most gold medals
-    top_continent = continent_medals.nlargest(1, 'Gold Medal')
-    if not top_continent.empty:  # Check the DataFrame isn't empty
+    if not continent_medals.empty:  # Check the DataFrame isn't empty
+        # .idxmax() returns the row label of the largest value, .loc[] fetches that row
+        top_continent = continent_medals.loc[continent_medals['Gold Medal'].idxmax()]
         # st.metric() with a delta parameter shows a small secondary value
         st.metric(
             "🥇 Top Continent (Gold)",
-            top_continent.iloc[0]['continent'],  # .iloc[0] gets the first row
-            f"{int(top_continent.iloc[0]['Gold Medal'])} gold medals"  # This appears as a small value below
+            top_continent['continent'],
+            f"{int(top_continent['Gold Medal'])} gold medals"  # This appears as a small value below
         )
 
 with col2:
@@ -40,14 +40,10 @@ st.set_page_config(
 # =============================================================================
 # DATA LOADING WITH CACHING
 # =============================================================================
-# @st.cache_data decorator caches the function result
+# load_all_data() is cached with @st.cache_data inside utils/data_loader.py
 # This means the CSV files are only read once, even if the page reruns
 # This is critical for performance - without caching, data would reload on every interaction
-@st.cache_data
-def get_data():
-    return load_all_data()
-
-data = get_data()
+data = load_all_data()
 
 # Create sidebar filters and get the user's selections
 filters = create_sidebar_filters(data)
@@ -71,10 +67,11 @@ st.markdown("Search and explore detailed information about individual athletes")
 # Make a copy of the athletes data to avoid modifying the original cached data
 athletes_df = data['athletes'].copy()
 
-# Merge athletes with NOCs to get country names and continent information
-# This join adds 'country' and 'continent' columns to each athlete row
+# Merge athletes with NOCs to get country names
+# This join adds the NOC 'country' column to each athlete row
+# ('continent' is already there - load_all_data() adds it to the athletes data)
 athletes_df = athletes_df.merge(
-    data['nocs'][['code', 'country', 'continent']],  # Select only the columns we need
+    data['nocs'][['code', 'country']],  # Select only the columns we need
     left_on='country_code',  # Match on country_code in athletes
     right_on='code',  # Match on code in nocs
     how='left',  # Keep all athletes even if no NOC match found
@@ -206,9 +203,8 @@ age_view = st.radio("View age distribution by:", ["Sport", "Gender"], horizontal
 
 # Calculate ages from birth dates if available
 if 'birth_date' in athletes_analysis.columns:
-    # pd.to_datetime() converts strings to datetime objects
-    # errors='coerce' turns unparseable dates into NaT (Not a Time) instead of raising an error
-    athletes_analysis['birth_date'] = pd.to_datetime(athletes_analysis['birth_date'], errors='coerce')
+    # birth_date is already parsed into datetime objects by the data loader
+    # Missing birth dates are NaT (Not a Time), which give a missing age below
     
     # Calculate age as current year minus birth year
     # .dt.year extracts just the year from a datetime
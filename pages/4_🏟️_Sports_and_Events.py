@@ -12,7 +12,6 @@
 import streamlit as st  # The main framework for building web apps
 import plotly.express as px  # High-level charting library
 import plotly.graph_objects as go  # Lower-level Plotly for custom charts
-import pandas as pd  # Data manipulation library
 import sys
 import os
 
@@ -34,12 +33,8 @@ st.set_page_config(
 # =============================================================================
 # DATA LOADING
 # =============================================================================
-# Use caching to avoid reloading data on every user interaction
-@st.cache_data
-def get_data():
-    return load_all_data()
-
-data = get_data()
+# load_all_data() is cached, so data is not reloaded on every user interaction
+data = load_all_data()
 
 # Create sidebar filters for user interaction
 filters = create_sidebar_filters(data)
@@ -63,80 +58,104 @@ st.markdown("Visualize when events took place during the Games")
 # Get the schedule data
 schedule_df = data['schedule'].copy()
 
-# st.radio() creates a horizontal set of options for the user to choose from
-# horizontal=True places the options in a row instead of a vertical list
-timeline_view = st.radio("View schedule by:", ["Discipline", "Venue"], horizontal=True)
-
-# Show different selectors based on the user's choice
-if timeline_view == "Discipline":
-    # st.selectbox() creates a searchable dropdown menu
-    selected_discipline = st.selectbox(
-        "Select a discipline to view its schedule:",
-        options=sorted(schedule_df['discipline'].dropna().unique().tolist())
-    )
-    # Filter the schedule to only the selected discipline
-    schedule_filtered = schedule_df[schedule_df['discipline'] == selected_discipline].copy()
-else:
-    selected_venue = st.selectbox(
-        "Select a venue to view its schedule:",
-        options=sorted(schedule_df['venue'].dropna().unique().tolist())
+# The venue event counts and discipline count are used by several sections below
+# We compute them once here instead of repeating the same groupby in each section
+# The leading underscore tells Streamlit not to hash the DataFrame argument -
+# the schedule never changes while the app is running
+@st.cache_data
+def get_schedule_aggregates(_schedule_df):
+    """Count events per venue (busiest first) and the number of unique disciplines."""
+    venue_events = (
+        _schedule_df.groupby('venue')
+        .size()
+        .reset_index(name='event_count')
+        .sort_values('event_count', ascending=False)
     )
-    schedule_filtered = schedule_df[schedule_df['venue'] == selected_venue].copy()
-
-# Check if we have the date columns needed for a timeline/Gantt chart
-if 'start_date' in schedule_filtered.columns and 'end_date' in schedule_filtered.columns:
-    # Convert date columns to datetime objects
-    # errors='coerce' turns invalid dates into NaT (Not a Time) instead of raising an error
-    schedule_filtered['start_date'] = pd.to_datetime(schedule_filtered['start_date'], errors='coerce')
-    schedule_filtered['end_date'] = pd.to_datetime(schedule_filtered['end_date'], errors='coerce')
-    
-    # Remove any rows with invalid dates
-    schedule_filtered = schedule_filtered.dropna(subset=['start_date', 'end_date'])
-    
-    if len(schedule_filtered) > 0:
-        # px.timeline() creates a Gantt chart - perfect for showing time ranges
-        # Gantt charts show when activities start and end over time
-        fig_gantt = px.timeline(
-            schedule_filtered.head(50),  # Limit to 50 events for readability
-            x_start='start_date',  # When each event starts
-            x_end='end_date',  # When each event ends
-            y='event',  # Event names on the y-axis
-            # Color by the opposite of what we selected (show venue if filtering by discipline)
-            color='discipline' if timeline_view == "Venue" else 'venue',
-            title=f'Event Schedule for {selected_discipline if timeline_view == "Discipline" else selected_venue}',
-            labels={'event': 'Event', 'discipline': 'Discipline', 'venue': 'Venue'}
+    total_disciplines = _schedule_df['discipline'].nunique()
+    return venue_events, total_disciplines
+
+venue_events, total_disciplines = get_schedule_aggregates(schedule_df)
+
+# @st.fragment turns a function into an independent part of the page
+# When a widget inside the fragment changes (the radio button or dropdown below),
+# Streamlit reruns only this function instead of the whole page, so the medal
+# charts and venue map further down are not rebuilt for every schedule selection
+# Changing a sidebar filter still reruns the whole page, including the fragment
+@st.fragment
+def render_timeline(schedule_df):
+    """Draw the discipline/venue selector and the Gantt chart of matching events."""
+    # st.radio() creates a horizontal set of options for the user to choose from
+    # horizontal=True places the options in a row instead of a vertical list
+    timeline_view = st.radio("View schedule by:", ["Discipline", "Venue"], horizontal=True)
+
+    # Show different selectors based on the user's choice
+    if timeline_view == "Discipline":
+        # st.selectbox() creates a searchable dropdown menu
+        selected_discipline = st.selectbox(
+            "Select a discipline to view its schedule:",
+            options=sorted(schedule_df['discipline'].dropna().unique().tolist())
         )
-        
-        fig_gantt.update_layout(
-            height=600,
-            xaxis_title='Date',
-            yaxis_title='Event',
-            showlegend=True
+        # Filter the schedule to only the selected discipline
+        schedule_filtered = schedule_df[schedule_df['discipline'] == selected_discipline].copy()
+    else:
+        selected_venue = st.selectbox(
+            "Select a venue to view its schedule:",
+            options=sorted(schedule_df['venue'].dropna().unique().tolist())
         )
-        
-        st.plotly_chart(fig_gantt, use_container_width=True)
-        
-        # Show note if we're limiting results
-        if len(schedule_filtered) > 50:
-            st.info(f"📊 Showing 50 of {len(schedule_filtered)} events. Use filters to narrow down the view.")
+        schedule_filtered = schedule_df[schedule_df['venue'] == selected_venue].copy()
+
+    # Check if we have the date columns needed for a timeline/Gantt chart
+    if 'start_date' in schedule_filtered.columns and 'end_date' in schedule_filtered.columns:
+        # The data loader already parses these columns into datetime objects
+        # Remove any rows with missing (NaT) dates
+        schedule_filtered = schedule_filtered.dropna(subset=['start_date', 'end_date'])
+
+        if len(schedule_filtered) > 0:
+            # px.timeline() creates a Gantt chart - perfect for showing time ranges
+            # Gantt charts show when activities start and end over time
+            fig_gantt = px.timeline(
+                schedule_filtered.head(50),  # Limit to 50 events for readability
+                x_start='start_date',  # When each event starts
+                x_end='end_date',  # When each event ends
+                y='event',  # Event names on the y-axis
+                # Color by the opposite of what we selected (show venue if filtering by discipline)
+                color='discipline' if timeline_view == "Venue" else 'venue',
+                title=f'Event Schedule for {selected_discipline if timeline_view == "Discipline" else selected_venue}',
+                labels={'event': 'Event', 'discipline': 'Discipline', 'venue': 'Venue'}
+            )
+
+            fig_gantt.update_layout(
+                height=600,
+                xaxis_title='Date',
+                yaxis_title='Event',
+                showlegend=True
+            )
+
+            st.plotly_chart(fig_gantt, use_container_width=True)
+
+            # Show note if we're limiting results
+            if len(schedule_filtered) > 50:
+                st.info(f"📊 Showing 50 of {len(schedule_filtered)} events. Use filters to narrow down the view.")
+        else:
+            # st.warning() displays an orange warning box
+            st.warning("No valid date information available for the selected filter.")
     else:
-        # st.warning() displays an orange warning box
-        st.warning("No valid date information available for the selected filter.")
-else:
-    # Fallback when detailed timing data isn't available
-    st.info("Detailed timeline data not available. Showing event distribution instead.")
-    
-    # Simple bar chart counting events
-    event_counts = schedule_filtered.groupby('event').size().reset_index(name='count').head(20)
-    fig_bar = px.bar(
-        event_counts,
-        x='event',
-        y='count',
-        title=f'Events in {selected_discipline if timeline_view == "Discipline" else selected_venue}',
-        labels={'count': 'Occurrences', 'event': 'Event'}
-    )
-    fig_bar.update_layout(height=400)
-    st.plotly_chart(fig_bar, use_container_width=True)
+        # Fallback when detailed timing data isn't available
+        st.info("Detailed timeline data not available. Showing event distribution instead.")
+
+        # Simple bar chart counting events
+        event_counts = schedule_filtered.groupby('event').size().reset_index(name='count').head(20)
+        fig_bar = px.bar(
+            event_counts,
+            x='event',
+            y='count',
+            title=f'Events in {selected_discipline if timeline_view == "Discipline" else selected_venue}',
+            labels={'count': 'Occurrences', 'event': 'Event'}
+        )
+        fig_bar.update_layout(height=400)
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+render_timeline(schedule_df)
 
 st.markdown("---")
 
@@ -159,14 +178,8 @@ if filters['sports']:
 if filters['medal_types']:
     medals_detail = medals_detail[medals_detail['medal_type'].isin(filters['medal_types'])]
 
-# Add continent information
-medals_detail = medals_detail.merge(
-    data['nocs'][['code', 'continent']],
-    left_on='country_code',
-    right_on='code',
-    how='left'
-)
-
+# No merge needed for the continent filter: load_all_data() already added
+# a 'continent' column to the medals data
 if filters['continents']:
     medals_detail = medals_detail[medals_detail['continent'].isin(filters['continents'])]
 
@@ -267,16 +280,17 @@ if 'lat' in venues_df.columns and 'lon' in venues_df.columns:
         
         with col2:
             # Find the venue that hosted the most events
-            venue_events = schedule_df.groupby('venue').size().reset_index(name='event_count')
             if len(venue_events) > 0:
-                busiest_venue = venue_events.nlargest(1, 'event_count')
-                venue_name = busiest_venue.iloc[0]['venue']
+                # .idxmax() finds the row label of the largest value in a single pass
+                # .loc[] then fetches that one row - no sorting needed
+                busiest_venue = venue_events.loc[venue_events['event_count'].idxmax()]
+                venue_name = busiest_venue['venue']
                 # Truncate long names
                 display_name = venue_name[:30] + "..." if len(venue_name) > 30 else venue_name
                 st.metric(
                     "Busiest Venue",
                     display_name,
-                    f"{int(busiest_venue.iloc[0]['event_count'])} events"
+                    f"{int(busiest_venue['event_count'])} events"
                 )
     else:
         st.warning("No coordinate data available for venues.")
@@ -286,9 +300,7 @@ else:
     # Fallback when we don't have lat/lon data
     st.info("Geographic coordinates not available. Showing venue information:")
     
-    # Show venues with their event counts
-    venue_events = schedule_df.groupby('venue').size().reset_index(name='event_count').sort_values('event_count', ascending=False)
-    
+    # Show venues with their event counts (venue_events is already sorted busiest first)
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -315,9 +327,8 @@ st.subheader("📊 Sports & Events Insights")
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    # Count unique disciplines in the schedule
-    total_sports = schedule_df['discipline'].nunique()
-    st.metric("Total Disciplines", total_sports)
+    # Count unique disciplines in the schedule (computed once above)
+    st.metric("Total Disciplines", total_disciplines)
 
 with col2:
     # Total number of events
@@ -327,14 +338,14 @@ with col2:
 with col3:
     # Find the sport with the most medals awarded
     if len(sport_totals) > 0:
-        top_sport = sport_totals.nlargest(1, 'total')
-        sport_name = top_sport.iloc[0]['discipline']
+        top_sport = sport_totals.loc[sport_totals['total'].idxmax()]
+        sport_name = top_sport['discipline']
         # Truncate long sport names
         display_name = sport_name[:25] + "..." if len(sport_name) > 25 else sport_name
         st.metric(
             "Most Medals Awarded",
             display_name,
-            f"{int(top_sport.iloc[0]['total'])} medals"
+            f"{int(top_sport['total'])} medals"
         )
 
 # =============================================================================
@@ -343,15 +354,24 @@ with col3:
 st.markdown("---")
 st.subheader("⚔️ Sport-by-Sport Medal Comparison")
 
+# Only chart the top 20 disciplines by total medals
+# This keeps the chart readable and sends far fewer bars to the browser
+top_disciplines = sport_totals.nlargest(20, 'total')['discipline']
+top_sport_medals = sport_medals[sport_medals['discipline'].isin(top_disciplines)]
+
 # Stacked bar chart showing medal breakdown by sport
 fig_sport_compare = px.bar(
-    sport_medals,
+    top_sport_medals,
     x='discipline',  # Sports on x-axis
     y='count',  # Medal counts on y-axis
     color='medal_type',  # Stack by medal type
     barmode='stack',  # Stack the bars on top of each other
-    title='Medal Distribution Across All Disciplines',
+    # nlargest() returns fewer than 20 rows when the filters leave fewer disciplines
+    title=f'Medal Distribution Across the Top {len(top_disciplines)} Disciplines',
     labels={'count': 'Number of Medals', 'discipline': 'Discipline'},
+    # category_orders fixes the bar order up front (already highest total first),
+    # so Plotly doesn't need to sort the categories itself
+    category_orders={'discipline': top_disciplines.tolist()},
     color_discrete_map={
         'Gold Medal': '#FFD700',
         'Silver Medal': '#C0C0C0',
@@ -361,7 +381,6 @@ fig_sport_compare = px.bar(
 )
 
 fig_sport_compare.update_layout(
-    xaxis={'categoryorder': 'total descending'},  # Order by total medals
     showlegend=True,
     legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
 )
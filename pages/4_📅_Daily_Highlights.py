@@ -40,17 +40,33 @@ medals = data['medals']  # Detailed medal records
 # =============================================================================
 # PREPARE DATE DATA
 # =============================================================================
-# Convert the date columns from strings to datetime objects
-# pd.to_datetime() handles various date formats automatically
-schedule['day'] = pd.to_datetime(schedule['day'])
-medals['medal_date'] = pd.to_datetime(medals['medal_date'])
+# The 'day' and 'medal_date' columns are already parsed into datetime objects
+# by the data loader, so we can compare and format them directly
 
-# Get a sorted list of all unique dates in the schedule
-available_dates = sorted(schedule['day'].unique())
+# The list of dates never changes, so we build the slider options once and cache them
+# The leading underscore tells Streamlit not to hash the column on every rerun
+@st.cache_data
+def get_date_options(_schedule_days):
+    """
+    Build the date slider options from the schedule's 'day' column.
+    
+    Returns:
+        tuple: (formatted_dates, date_lookup) where formatted_dates is a sorted
+               list of 'YYYY-MM-DD' strings and date_lookup maps each string
+               back to its Timestamp
+    """
+    # Get a sorted index of all unique dates in the schedule
+    available_dates = pd.DatetimeIndex(_schedule_days.unique()).sort_values()
+    
+    # Convert dates to string format for the slider display
+    # .strftime() formats every date at once; '%Y-%m-%d' gives 'YYYY-MM-DD' format
+    formatted_dates = available_dates.strftime('%Y-%m-%d').tolist()
+    
+    # Reverse lookup so the selected string can be turned back into a date instantly
+    date_lookup = dict(zip(formatted_dates, available_dates))
+    return formatted_dates, date_lookup
 
-# Convert dates to string format for the slider display
-# strftime() formats the date as a string; '%Y-%m-%d' gives 'YYYY-MM-DD' format
-formatted_dates = [d.strftime('%Y-%m-%d') for d in available_dates]
+formatted_dates, date_lookup = get_date_options(schedule['day'])
 
 # =============================================================================
 # DATE SELECTOR
@@ -66,8 +82,8 @@ selected_date_str = st.select_slider(
 
 # Only proceed if a date was selected
 if selected_date_str:
-    # Convert the selected string back to a datetime for filtering
-    selected_date = pd.to_datetime(selected_date_str)
+    # Look up the datetime for the selected string (used for filtering)
+    selected_date = date_lookup[selected_date_str]
     
     # =============================================================================
     # FILTER DATA FOR SELECTED DATE
@@ -153,10 +169,6 @@ if selected_date_str:
     else:
         st.info("No medal winners data available for this date.")
 
-# ... (existing imports)
-
-# ... (existing code)
-
     # =============================================================================
     # EVENTS SCHEDULE TABLE
     # =============================================================================
@@ -167,7 +179,7 @@ if selected_date_str:
     
     # Format the start time to show just hours and minutes
     # .dt.strftime('%H:%M') formats as 24-hour time
-    display_schedule['start_date'] = pd.to_datetime(display_schedule['start_date']).dt.strftime('%H:%M')
+    display_schedule['start_date'] = display_schedule['start_date'].dt.strftime('%H:%M')
     # Rename the column to be clearer
     display_schedule.rename(columns={'start_date': 'Time'}, inplace=True)
     
@@ -193,9 +205,11 @@ if selected_date_str:
     map_data = []
     
     # Iterate through each event in the daily schedule
-    # iterrows() yields (index, row) pairs for each row in the DataFrame
-    for index, row in daily_schedule.iterrows():
-        venue = row['venue']
+    # itertuples() yields each row as a lightweight named tuple (row.venue, ...);
+    # unlike iterrows() it doesn't build a whole pandas Series for every row.
+    # Selecting the three columns first means only those values are unpacked
+    for row in daily_schedule[['venue', 'discipline', 'event']].itertuples(index=False):
+        venue = row.venue
         # Look up the coordinates for this venue
         coords = get_venue_coordinates(venue)
         if coords:  # Only add venues we have coordinates for
@@ -203,8 +217,8 @@ if selected_date_str:
                 'lat': coords[0],
                 'lon': coords[1],
                 'venue': venue,
-                'discipline': row['discipline'],
-                'event': row['event']
+                'discipline': row.discipline,
+                'event': row.event
             })
             
     if map_data:
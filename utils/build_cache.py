@@ -0,0 +1,40 @@
+# =============================================================================
+# DATA BUNDLE BUILDER
+# =============================================================================
+# This script builds the prebuilt data bundle used by load_all_data().
+# 
+# It loads and prepares every dataset once (continents, categoricals, dates...)
+# and saves each final DataFrame as a Parquet file in BUNDLE_PATH. On the next
+# cold start, load_all_data() just reads these files back, skipping all the
+# CSV parsing and preparation steps.
+# 
+# Run it from the project root after changing the CSV files or data_loader.py
+# (an outdated bundle is ignored automatically, so forgetting is not an error):
+#     python -m utils.build_cache
+# =============================================================================
+
+import os  # For file path operations
+from utils.data_loader import BUNDLE_FILES, build_all_data, write_parquet
+
+
+def build_bundle():
+    """
+    Build all datasets and write each one to BUNDLE_PATH as a Parquet file.
+    
+    Returns:
+        list: Paths of the files that were written
+    """
+    written = []
+    for name, df in build_all_data().items():
+        bundle_file = BUNDLE_FILES[name]
+        # write_parquet() writes to a unique temporary file and renames it into
+        # place, so a running dashboard never reads a half-written file, and
+        # removes the files of older bundle formats
+        write_parquet(df, bundle_file)
+        written.append(bundle_file)
+    return written
+
+
+if __name__ == "__main__":
+    for path in build_bundle():
+        print(f"Wrote {os.path.normpath(path)}")
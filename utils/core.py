@@ -0,0 +1,179 @@
+# =============================================================================
+# CORE DATA HELPERS
+# =============================================================================
+# The parts of the data utilities that don't need Streamlit: the continent
+# mapping and the DataFrame filter function.
+# They live in their own module so that scripts (or anything else that only
+# needs these helpers) can import them without importing Streamlit, which takes
+# much longer to import than pandas and NumPy.
+# utils/data_loader.py imports everything from here, so the pages can keep
+# importing these names from utils.data_loader.
+# =============================================================================
+
+from types import MappingProxyType  # For the read-only continent mapping
+import numpy as np  # For combining the filter masks
+
+# =============================================================================
+# CONTINENT MAPPING
+# =============================================================================
+# The raw data doesn't include continent information for countries.
+# CONTINENT_MAP maps IOC country codes to continent names.
+# This allows us to group and filter countries by continent in the dashboard.
+# It is a module-level constant (built once when the module is imported), so it
+# doesn't need Streamlit caching, which would hash and copy it on every call.
+# This is manually maintained since the Olympics data doesn't include continents.
+
+CONTINENT_MAP = {
+    # Europe - Western, Eastern, Northern, and Southern European countries
+    'ALB': 'Europe', 'AND': 'Europe', 'ARM': 'Europe', 'AUT': 'Europe', 'AZE': 'Europe',
+    'BLR': 'Europe', 'BEL': 'Europe', 'BIH': 'Europe', 'BUL': 'Europe', 'CRO': 'Europe',
+    'CYP': 'Europe', 'CZE': 'Europe', 'DEN': 'Europe', 'ESP': 'Europe', 'EST': 'Europe',
+    'FIN': 'Europe', 'FRA': 'Europe', 'GBR': 'Europe', 'GEO': 'Europe', 'GER': 'Europe',
+    'GRE': 'Europe', 'HUN': 'Europe', 'IRL': 'Europe', 'ISL': 'Europe', 'ISR': 'Europe',
+    'ITA': 'Europe', 'KOS': 'Europe', 'LAT': 'Europe', 'LIE': 'Europe', 'LTU': 'Europe',
+    'LUX': 'Europe', 'MDA': 'Europe', 'MKD': 'Europe', 'MLT': 'Europe', 'MNE': 'Europe',
+    'NED': 'Europe', 'NOR': 'Europe', 'POL': 'Europe', 'POR': 'Europe', 'ROU': 'Europe',
+    'SRB': 'Europe', 'SVK': 'Europe', 'SLO': 'Europe', 'SUI': 'Europe', 'SWE': 'Europe',
+    'TUR': 'Europe', 'UKR': 'Europe', 'SMR': 'Europe', 'MON': 'Europe',
+    
+    # Asia - East, Southeast, South, Central, and West Asian countries
+    'AFG': 'Asia', 'BRN': 'Asia', 'BAN': 'Asia', 'BHU': 'Asia', 'BRU': 'Asia',
+    'CAM': 'Asia', 'CHN': 'Asia', 'TPE': 'Asia', 'IND': 'Asia', 'INA': 'Asia',
+    'IRI': 'Asia', 'IRQ': 'Asia', 'JPN': 'Asia', 'JOR': 'Asia', 'KAZ': 'Asia',
+    'KOR': 'Asia', 'KUW': 'Asia', 'KGZ': 'Asia', 'LAO': 'Asia', 'LBN': 'Asia',
+    'MAS': 'Asia', 'MDV': 'Asia', 'MGL': 'Asia', 'MYA': 'Asia', 'NEP': 'Asia',
+    'OMA': 'Asia', 'PAK': 'Asia', 'PLE': 'Asia', 'PHI': 'Asia', 'QAT': 'Asia',
+    'KSA': 'Asia', 'SGP': 'Asia', 'SRI': 'Asia', 'SYR': 'Asia', 'TJK': 'Asia',
+    'THA': 'Asia', 'TLS': 'Asia', 'TKM': 'Asia', 'UAE': 'Asia', 'UZB': 'Asia',
+    'VIE': 'Asia', 'YEM': 'Asia', 'HKG': 'Asia', 'PRK': 'Asia',
+    
+    # Africa - North, West, East, Central, and Southern African countries
+    'ALG': 'Africa', 'ANG': 'Africa', 'BEN': 'Africa', 'BOT': 'Africa', 'BUR': 'Africa',
+    'BDI': 'Africa', 'CMR': 'Africa', 'CPV': 'Africa', 'CAF': 'Africa', 'CHA': 'Africa',
+    'COM': 'Africa', 'CGO': 'Africa', 'CIV': 'Africa', 'COD': 'Africa', 'DJI': 'Africa',
+    'EGY': 'Africa', 'GEQ': 'Africa', 'ERI': 'Africa', 'ETH': 'Africa', 'GAB': 'Africa',
+    'GAM': 'Africa', 'GHA': 'Africa', 'GUI': 'Africa', 'GBS': 'Africa', 'KEN': 'Africa',
+    'LES': 'Africa', 'LBR': 'Africa', 'LBA': 'Africa', 'MAD': 'Africa', 'MAW': 'Africa',
+    'MLI': 'Africa', 'MRI': 'Africa', 'MAR': 'Africa', 'MOZ': 'Africa', 'NAM': 'Africa',
+    'NIG': 'Africa', 'NGR': 'Africa', 'RWA': 'Africa', 'STP': 'Africa', 'SEN': 'Africa',
+    'SEY': 'Africa', 'SLE': 'Africa', 'SOM': 'Africa', 'RSA': 'Africa', 'SSD': 'Africa',
+    'SUD': 'Africa', 'TAN': 'Africa', 'TOG': 'Africa', 'TUN': 'Africa', 'UGA': 'Africa',
+    'ZAM': 'Africa', 'ZIM': 'Africa',
+    
+    # North America - Including Central America and Caribbean nations
+    'ANT': 'North America', 'ARU': 'North America', 'BAH': 'North America', 'BAR': 'North America',
+    'BIZ': 'North America', 'BER': 'North America', 'CAN': 'North America', 'CAY': 'North America',
+    'CRC': 'North America', 'CUB': 'North America', 'DMA': 'North America', 'DOM': 'North America',
+    'ESA': 'North America', 'GRN': 'North America', 'GUA': 'North America', 'HAI': 'North America',
+    'HON': 'North America', 'JAM': 'North America', 'MEX': 'North America', 'NCA': 'North America',
+    'PAN': 'North America', 'PUR': 'North America', 'SKN': 'North America', 'LCA': 'North America',
+    'VIN': 'North America', 'TTO': 'North America', 'USA': 'North America', 'ISV': 'North America',
+    
+    # South America
+    'ARG': 'South America', 'BOL': 'South America', 'BRA': 'South America', 'CHI': 'South America',
+    'COL': 'South America', 'ECU': 'South America', 'GUY': 'South America', 'PAR': 'South America',
+    'PER': 'South America', 'SUR': 'South America', 'URU': 'South America', 'VEN': 'South America',
+    
+    # Oceania - Australia, New Zealand, and Pacific Island nations
+    'ASA': 'Oceania', 'AUS': 'Oceania', 'COK': 'Oceania', 'FIJ': 'Oceania', 'FSM': 'Oceania',
+    'GUM': 'Oceania', 'KIR': 'Oceania', 'MHL': 'Oceania', 'NRU': 'Oceania', 'NZL': 'Oceania',
+    'PLW': 'Oceania', 'PNG': 'Oceania', 'SAM': 'Oceania', 'SOL': 'Oceania', 'TGA': 'Oceania',
+    'TUV': 'Oceania', 'VAN': 'Oceania',
+}
+
+# Read-only view, so no page can modify the shared mapping by accident
+CONTINENT_MAP = MappingProxyType(CONTINENT_MAP)
+
+
+# =============================================================================
+# FILTER FUNCTION
+# =============================================================================
+# This function applies user-selected filters to a DataFrame.
+# It's used throughout the dashboard to filter data based on sidebar selections.
+
+# Every medal type in the dataset, in the order of the Gold/Silver/Bronze
+# checkboxes in the sidebar (utils/filters.py builds them from this tuple)
+MEDAL_TYPES = ('Gold Medal', 'Silver Medal', 'Bronze Medal')
+
+# The same medal types as a set, for the "all selected" check in apply_filters()
+ALL_MEDAL_TYPES = frozenset(MEDAL_TYPES)
+
+
+def apply_filters(data, filters):
+    """
+    Apply user-selected filters to a DataFrame.
+    
+    This function takes a DataFrame and a dictionary of filter selections,
+    then returns a filtered copy of the DataFrame based on those selections.
+    
+    Args:
+        data: A pandas DataFrame to filter
+        filters: A dictionary with keys like 'countries', 'sports', 'medal_types', 'continents'
+                Each value is a list of selected values for that filter.
+                Empty list means no filter is applied for that category.
+    
+    Returns:
+        A filtered copy of the input DataFrame, or the input DataFrame itself
+        when the filters keep every row (callers must not modify it in place)
+    """
+    #the filter works here by taking the full dataframe and a dictionary of selected filters
+    #then show only the data pertinent to the selected filters
+    
+    # Turn each selection list into a frozenset once at the start, so the
+    # .isin() calls below receive ready-made hashed sets of values.
+    # Empty selections become empty sets and are still skipped below
+    filters = {
+        key: frozenset(values) if isinstance(values, (list, tuple)) else values
+        for key, values in filters.items()
+    }
+
+    # All three medal checkboxes ticked (their default) keeps every medal,
+    # so it's the same as not filtering on medal type at all
+    if (filters.get('medal_types') or frozenset()) >= ALL_MEDAL_TYPES:
+        filters['medal_types'] = frozenset()
+
+    # Nothing selected in the sidebar (the usual state when a page first loads):
+    # return the DataFrame untouched without building any masks
+    if not any(filters.get(key) for key in ('countries', 'sports', 'medal_types', 'continents')):
+        return data
+
+    # One boolean NumPy array for all filters: it starts with every row selected
+    # and each active filter ANDs its own condition into it in place, so no
+    # intermediate DataFrame (or per-filter mask list) is ever built
+    mask = np.ones(len(data), dtype=bool)
+
+    # Apply country filter if countries are selected
+    if filters.get('countries'):
+        # Check which column name the DataFrame uses for country codes
+        if 'country_code' in data.columns:
+            # .isin() returns True for rows where the value is in the provided list
+            # On categorical columns this compares integer codes, not strings.
+            # On Arrow-backed string columns (the default text type in pandas 3)
+            # pandas already runs it as pyarrow.compute.is_in, so no helper is needed
+            mask &= data['country_code'].isin(filters['countries']).to_numpy()
+            #keeping the rows whome country code is in the filters of countries list
+        elif 'code' in data.columns:
+            # Some DataFrames use 'code' instead of 'country_code'
+            mask &= data['code'].isin(filters['countries']).to_numpy()
+    
+    # Apply sport filter if sports are selected and the column exists
+    #if the filter of sports is applied and the sport is in the current dataframe     
+    if filters.get('sports') and 'sport' in data.columns:
+        mask &= data['sport'].isin(filters['sports']).to_numpy()
+
+    # Apply medal type filter
+    if filters.get('medal_types') and 'medal_type' in data.columns:
+        mask &= data['medal_type'].isin(filters['medal_types']).to_numpy()
+
+    # Apply continent filter
+    if filters.get('continents') and 'continent' in data.columns:
+        mask &= data['continent'].isin(filters['continents']).to_numpy()
+
+    # Every row still selected (e.g. the selected filters don't apply to this
+    # DataFrame's columns): nothing to remove, so skip copying the DataFrame
+    if mask.all():
+        return data
+
+    # Index the DataFrame a single time with the combined mask.
+    # .loc with a boolean array returns a new DataFrame, so the original is never modified
+    return data.loc[mask]
@@ -7,6 +7,8 @@
 # from flagcdn.com instead. This provides consistent rendering across all OS.
 # =============================================================================
 
+from functools import lru_cache  # Memoize the HTML helpers below
+
 # Mapping from IOC codes to ISO 2-letter codes (needed for flag images)
 # Flag CDNs use ISO 3166-1 alpha-2 codes (2 letters)
 IOC_TO_ISO2 = {
@@ -59,6 +61,63 @@ IOC_TO_ISO2 = {
 }
 
 
+# =============================================================================
+# PRECOMPUTED LOOKUP TABLES
+# =============================================================================
+# The set of country codes is fixed, so we build every flag emoji and every
+# default-size flag URL once at import time. Each helper call below then becomes
+# a single dict lookup instead of rebuilding the string every time.
+# The tables hold both the upper-case ('USA') and lower-case ('usa') form of each
+# IOC code, so the common cases don't need a .upper() call before the lookup.
+
+def _iso2_to_emoji(iso2):
+    """Convert an ISO-2 code to its flag emoji (two regional indicator symbols)."""
+    # Each letter A-Z maps to the regional indicator symbol at 0x1F1E6 + (letter - 'A').
+    # Anything that isn't two ASCII letters (e.g. 'ÉS') has no flag, and would
+    # fail the ASCII encoding below
+    if not (iso2.isascii() and iso2.isalpha()):
+        return '🏳️'
+    # Encoding to ASCII gives us both letters as ints (65 == ord('A')) in one step
+    first, second = iso2.upper().encode('ascii')
+    return chr(0x1F1E6 + first - 65) + chr(0x1F1E6 + second - 65)
+
+
+# Default flag width used across the dashboard
+DEFAULT_FLAG_SIZE = 20
+
+def _code_spellings(ioc):
+    """Return the upper- and lower-case forms of an IOC code."""
+    return (ioc, ioc.lower())
+
+
+# {IOC code: flag emoji}
+_FLAG_EMOJI = {
+    code: _iso2_to_emoji(iso2)
+    for ioc, iso2 in IOC_TO_ISO2.items()
+    for code in _code_spellings(ioc)
+}
+
+# {image width: URL template with a %s placeholder for the ISO-2 code}
+# Filled in on demand by _get_url_template(), one template per size
+_URL_TEMPLATE_CACHE = {}
+
+
+def _get_url_template(size):
+    """Return the flagcdn.com URL template for a given image width."""
+    template = _URL_TEMPLATE_CACHE.get(size)
+    if template is None:
+        template = _URL_TEMPLATE_CACHE[size] = f"https://flagcdn.com/w{size}/%s.png"
+    return template
+
+
+# {IOC code: flag image URL at the default width}
+_FLAG_URL_20 = {
+    code: _get_url_template(DEFAULT_FLAG_SIZE) % iso2
+    for ioc, iso2 in IOC_TO_ISO2.items()
+    for code in _code_spellings(ioc)
+}
+
+
 def get_flag_emoji(country_code):
     """
     Convert a country code to a flag emoji.
@@ -68,26 +127,22 @@ def get_flag_emoji(country_code):
     if not country_code:
         return '🏳️'
     
-    # Get ISO-2 code
+    # IOC codes come straight from the precomputed table
+    # (mixed-case spellings like 'Usa' are the only ones that still need .upper())
     if len(country_code) == 3:
-        iso2 = IOC_TO_ISO2.get(country_code.upper(), '').upper()
-    elif len(country_code) == 2:
-        iso2 = country_code.upper()
-    else:
-        return '🏳️'
-    
-    if not iso2:
-        return '🏳️'
+        flag = _FLAG_EMOJI.get(country_code)
+        if flag is None:
+            flag = _FLAG_EMOJI.get(country_code.upper(), '🏳️')
+        return flag
     
-    # Convert to regional indicator symbols
-    flag = ''
-    for char in iso2:
-        flag += chr(0x1F1E6 + ord(char) - ord('A'))
+    # ISO-2 codes are converted directly
+    if len(country_code) == 2:
+        return _iso2_to_emoji(country_code)
     
-    return flag
+    return '🏳️'
 
 
-def get_flag_url(country_code, size=20):
+def get_flag_url(country_code, size=DEFAULT_FLAG_SIZE):
     """
     Get the URL for a country flag image from flagcdn.com.
     
@@ -98,21 +153,30 @@ def get_flag_url(country_code, size=20):
     Returns:
         URL string to the flag image
     """
-    if not country_code:
-        return f"https://flagcdn.com/w{size}/un.png"
+    # Fast path: IOC code at the default size is a single dict lookup
+    if size == DEFAULT_FLAG_SIZE and country_code and len(country_code) == 3:
+        url = _FLAG_URL_20.get(country_code)
+        if url:
+            return url
     
     # Get ISO-2 code (lowercase for the CDN)
-    if len(country_code) == 3:
+    if not country_code:
+        iso2 = 'un'
+    elif len(country_code) == 3:
         iso2 = IOC_TO_ISO2.get(country_code.upper(), 'un')
     elif len(country_code) == 2:
         iso2 = country_code.lower()
     else:
         iso2 = 'un'
     
-    return f"https://flagcdn.com/w{size}/{iso2}.png"
+    return _get_url_template(size) % iso2
 
 
-def get_flag_html(country_code, size=20):
+# The HTML helpers are called once per row when rendering tables, mostly with the
+# same (code, size) pairs. lru_cache returns the already-built string for repeats,
+# and since the functions live at module level the cache survives Streamlit reruns.
+@lru_cache(maxsize=4096)
+def get_flag_html(country_code, size=DEFAULT_FLAG_SIZE):
     """
     Get an HTML img tag for a country flag.
     Use this in Streamlit with st.markdown(..., unsafe_allow_html=True)
@@ -128,7 +192,8 @@ def get_flag_html(country_code, size=20):
     return f'<img src="{url}" width="{size}" style="vertical-align: middle; margin-right: 5px;">'
 
 
-def get_country_with_flag(country_code, country_name=None, size=20):
+@lru_cache(maxsize=4096)
+def get_country_with_flag(country_code, country_name=None, size=DEFAULT_FLAG_SIZE):
     """
     Get HTML for a country name with its flag image inline.
     
@@ -7,15 +7,27 @@
 # 
 # The module provides:
 # - Individual loading functions for each CSV file
-# - A continent mapping for countries (since the raw data doesn't include this)
+# - A continent column for countries (the mapping itself is in utils/core.py)
 # - A combined function to load all data at once
-# - A filter function to filter DataFrames based on user selections
+# - The filter function from utils/core.py (imported here for the pages)
 # =============================================================================
 
 import os  # For file path operations
+import glob  # For finding cache files written in an older format
+import hashlib  # For the cache format keys
+import tempfile  # For unique temporary files while writing the caches
+from concurrent.futures import ThreadPoolExecutor  # For loading the files in parallel
+import numpy as np  # For the continent lookup tables
 import pandas as pd  # For reading CSVs and working with DataFrames
+import pyarrow as pa  # Only for its version number (part of the cache format key)
 import streamlit as st  # For the caching decorator
 
+# The continent mapping and the filter function don't need Streamlit, so they
+# are defined in utils/core.py and imported here (pages can keep importing them
+# from utils.data_loader)
+from utils import core
+from utils.core import CONTINENT_MAP, apply_filters  # noqa: F401 (apply_filters is re-exported)
+
 # =============================================================================
 # PATH CONFIGURATION
 # =============================================================================
@@ -32,235 +44,490 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "..", "paris-2024-olympic-summer-games", "versions", "27")
 #using the base dir and data path to handle different operating systems
 
+# Folder where Parquet copies of the CSV files are stored (created on first load)
+CACHE_PATH = os.path.join(DATA_PATH, "_cache")
+
+# Folder with a prebuilt bundle of all the final, processed DataFrames
+# (written by utils/build_cache.py, used by load_all_data() when present)
+BUNDLE_PATH = os.path.join(DATA_PATH, "_bundle")
+
+# Source CSV file of each dataset returned by load_all_data()
+DATASET_FILES = {
+    'athletes': 'athletes.csv',
+    'coaches': 'coaches.csv',
+    'events': 'events.csv',
+    'medals': 'medals.csv',
+    'medals_total': 'medals_total.csv',
+    'medalists': 'medallists.csv',
+    'nocs': 'nocs.csv',
+    'schedule': 'schedules.csv',
+    'teams': 'teams.csv',
+    'venues': 'venues.csv',
+}
+
+# Full paths of every dataset's files, joined once here instead of on every load:
+# - CSV_PATHS: the source CSV file in DATA_PATH
+# - CACHE_FILES: its Parquet copy in CACHE_PATH
+# - BUNDLE_FILES: its final, prepared DataFrame in BUNDLE_PATH
+# (the last two are defined below the reading options, since their file names
+# include a key of those options)
+CSV_PATHS = {name: os.path.join(DATA_PATH, csv_name) for name, csv_name in DATASET_FILES.items()}
+
+# =============================================================================
+# CSV READING OPTIONS
+# =============================================================================
+# The larger CSV files contain many free-text columns (hobbies, biographies,
+# URLs...) that no page ever displays. Listing only the columns the dashboard
+# uses means those columns are never parsed or kept in memory.
+# Files that are not listed here are small, so all their columns are loaded.
+# Keep these lists in sync with the pages: a column that no page reads should
+# not be listed (e.g. medallists.csv is only used for the top medalists chart,
+# which needs just the name, medal type and country).
+NEEDED_COLUMNS = {
+    "athletes.csv": [
+        'code', 'name', 'gender', 'country_code', 'country', 'height', 'weight',
+        'disciplines', 'events', 'birth_date', 'coach',
+    ],
+    "medals.csv": [
+        'medal_type', 'medal_date', 'name', 'discipline', 'event',
+        'country_code', 'country',
+    ],
+    "medallists.csv": ['medal_type', 'name', 'country_code'],
+    "schedules.csv": [
+        'start_date', 'end_date', 'day', 'status', 'discipline', 'event',
+        'event_medal', 'venue',
+    ],
+}
+
+# Date-only columns that should be parsed into datetime64 while reading,
+# so the pages don't need to call pd.to_datetime() on every rerun
+DATE_COLUMNS = {
+    "athletes.csv": ['birth_date'],
+    "medals.csv": ['medal_date'],
+    "schedules.csv": ['day'],
+}
+
+# Columns that the sidebar filters compare against with .isin(), read directly
+# as pandas categoricals.
+# These hold a few hundred distinct values repeated across thousands of rows,
+# so storing them as categoricals lets .isin() compare small integer codes
+# instead of Python strings, and uses much less memory. The Parquet copies keep
+# them dictionary-encoded, so they come back as categoricals without any work.
+# A categorical also keeps each distinct code string only once (in its
+# categories), so there's no need to sys.intern() the codes row by row.
+# In nocs 'code' is the country code, but in athletes/coaches/teams 'code' is a
+# unique person/team ID, so it is only listed for nocs.
+# Two filter columns are left as plain text on purpose:
+# - 'medal_type': the pages pivot on it, and categorical column labels would
+#   break adding the 'Total' column afterwards
+# - 'continent': it only has a handful of values, and it ends up in the
+#   frames behind the sunburst/treemap, where pandas 2 would add empty groups
+#   for unused categories
+# Note: groupby on a categorical column should pass observed=True so that
+# pandas 2 doesn't add empty groups for categories that were filtered out.
+CATEGORY_COLUMNS = {
+    "athletes.csv": ['country_code'],
+    "coaches.csv": ['country_code'],
+    "events.csv": ['sport'],
+    "medals.csv": ['country_code'],
+    "medals_total.csv": ['country_code'],
+    "medallists.csv": ['country_code'],
+    "nocs.csv": ['code'],
+    "teams.csv": ['country_code'],
+}
+
+# Numeric columns read with a smaller type than the default int64/float64.
+# Medal counts are small whole numbers, so int16 is plenty. We keep a signed
+# type on purpose: the pages subtract counts to show deltas, and unsigned
+# integers would wrap around instead of going negative.
+# Height and weight don't need 64-bit precision, float32 halves their memory.
+NUMERIC_DTYPES = {
+    "athletes.csv": {'height': 'float32', 'weight': 'float32'},
+    "medals_total.csv": {
+        'Gold Medal': 'int16', 'Silver Medal': 'int16',
+        'Bronze Medal': 'int16', 'Total': 'int16',
+    },
+}
+
+# Bump this number whenever _read_csv() changes in a way that changes the data
+# it returns (the option tables above are already part of the key below)
+CACHE_FORMAT_VERSION = 1
+
+
+def _format_key(*parts):
+    """Return a short hash of the given values, to tell cache files of different formats apart."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:12]
+
+
+# The Parquet copies store the columns and types that the options above and the
+# installed pandas/pyarrow versions produce. Their file names include a key of
+# all of these (e.g. "athletes.3f9c0a1b2d4e.parquet"), so a copy written with
+# other options or versions is never read back, even if its modification time
+# looks newer than this module (e.g. after copying the project with rsync -a)
+CACHE_FORMAT_KEY = _format_key(
+    CACHE_FORMAT_VERSION, NEEDED_COLUMNS, DATE_COLUMNS, CATEGORY_COLUMNS,
+    NUMERIC_DTYPES, pd.__version__, pa.__version__,
+)
+CACHE_FILES = {
+    name: os.path.join(CACHE_PATH, f"{os.path.splitext(csv_name)[0]}.{CACHE_FORMAT_KEY}.parquet")
+    for name, csv_name in DATASET_FILES.items()
+}
+
+# Bump this number whenever build_all_data() or DATASET_FIXES change the
+# prepared DataFrames
+BUNDLE_FORMAT_VERSION = 1
+
+# The bundle holds the final DataFrames, so on top of everything in the cache
+# key it depends on the preparation steps and the continent mapping
+BUNDLE_FORMAT_KEY = _format_key(
+    BUNDLE_FORMAT_VERSION, CACHE_FORMAT_KEY, sorted(CONTINENT_MAP.items()),
+)
+BUNDLE_FILES = {
+    name: os.path.join(BUNDLE_PATH, f"{name}.{BUNDLE_FORMAT_KEY}.parquet")
+    for name in DATASET_FILES
+}
+
+
+def _get_arrow_string_dtype():
+    """Return the Arrow-backed string dtype to convert text columns to, or None."""
+    # pandas 3 already stores text as Arrow-backed strings (dtype "str") that use
+    # NaN for missing values. pandas 2.1/2.2 offer the same type under the name
+    # "string[pyarrow_numpy]"; pandas 3 and older 2.x versions don't understand
+    # that name, and then there's nothing to convert.
+    try:
+        return pd.api.types.pandas_dtype("string[pyarrow_numpy]")
+    except TypeError:
+        return None
+
+
+# Arrow strings take a fraction of the memory of Python string objects and are
+# compared with vectorized Arrow kernels, which helps the large text columns
+# like athlete names. We avoid the plain "string[pyarrow]" type because it uses
+# pd.NA instead of NaN, which the pages are not written for.
+ARROW_STRING_DTYPE = _get_arrow_string_dtype()
+
+
+def _use_arrow_strings(df):
+    """Convert the text columns of a DataFrame to ARROW_STRING_DTYPE (if set)."""
+    if ARROW_STRING_DTYPE is not None:
+        # 'string' also catches text columns that a Parquet file restored with
+        # the pd.NA-based "string[python]" type
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
+        df[text_columns] = df[text_columns].astype(ARROW_STRING_DTYPE)
+    return df
+
+
+def _read_csv(name):
+    """Read the CSV file of one dataset using the fast pyarrow parser."""
+    # The reading options above are listed by file name
+    filename = DATASET_FILES[name]
+    # engine="pyarrow" parses the file with multiple threads in C++, which is
+    # several times faster than the default parser
+    # usecols / parse_dates are None for files without an entry above,
+    # which means "all columns" and "no date parsing"
+    # dtype turns the CATEGORY_COLUMNS of the file into categoricals and gives the
+    # NUMERIC_DTYPES columns their smaller types while reading, so the Parquet
+    # copy already stores the final types
+    # Note: we deliberately don't pass dtype_backend="pyarrow". With it, pandas
+    # ignores parse_dates (dates stay Arrow date32 values that never compare equal
+    # to a Timestamp) and every column uses pd.NA instead of NaN, which the pages
+    # are not written for. On pandas 3 the text columns are Arrow-backed anyway.
+    return pd.read_csv(
+        CSV_PATHS[name],
+        engine="pyarrow",
+        usecols=NEEDED_COLUMNS.get(filename),
+        parse_dates=DATE_COLUMNS.get(filename),
+        dtype={
+            **{col: "category" for col in CATEGORY_COLUMNS.get(filename, [])},
+            **NUMERIC_DTYPES.get(filename, {}),
+        },
+    )
+
+
+def write_parquet(df, path):
+    """
+    Write a DataFrame to a Parquet file safely, and remove older-format copies of it.
+    
+    The file is written to a uniquely named temporary file in the same folder and
+    then renamed into place, so no other session ever reads a half-written file,
+    and two sessions writing the same file at once don't get in each other's way.
+    
+    Args:
+        df: DataFrame to write
+        path: Final path of the file, named "<dataset>.<format key>.parquet"
+    """
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    os.close(fd)
+    try:
+        # zstd compresses noticeably better than the default snappy and is
+        # still very fast to decompress
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    
+    # Copies of the same dataset with another format key can never be used again
+    dataset = os.path.basename(path).split(".")[0]
+    for old_path in glob.glob(os.path.join(folder, f"{dataset}.*.parquet")):
+        if old_path != path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
+def _load_cached(name):
+    """
+    Load a dataset from its Parquet copy in CACHE_PATH, creating it from the CSV if needed.
+    
+    Parquet is a binary, column-based format that stores the column types,
+    so reading it skips all the text parsing a CSV needs. The CSV is parsed
+    only the first time (or after it changes), then the Parquet copy is used
+    on every later cold start, e.g. after the Streamlit server restarts.
+    
+    Args:
+        name: Dataset key from DATASET_FILES (e.g. 'athletes')
+    
+    Returns:
+        DataFrame with the dataset contents
+    """
+    csv_path = CSV_PATHS[name]
+    parquet_path = CACHE_FILES[name]
+    
+    # The Parquet copy is only valid if it is newer than both the CSV it was made
+    # from and this module (which decides the columns and types that get stored).
+    # A copy with other reading options or pandas/pyarrow versions has another
+    # file name (see CACHE_FORMAT_KEY), so it isn't found here at all
+    source_mtime = max(os.path.getmtime(csv_path), os.path.getmtime(__file__))
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= source_mtime:
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    
+    df = _read_csv(name)
+    try:
+        write_parquet(df, parquet_path)
+    except OSError:
+        # On a read-only file system we simply keep using the CSV
+        pass
+    return df
+
 # =============================================================================
 # INDIVIDUAL DATA LOADING FUNCTIONS
 # =============================================================================
-# Each function loads one CSV file. We use @st.cache_data on each one to ensure
-# the file is only read from disk once. After the first load, the data is cached
-# in memory and returned instantly on subsequent calls.
+# All datasets are read together by _load_all_frames(), which is cached with
+# @st.cache_data as a single entry. The files are only read from disk once;
+# after the first load, the data is cached and returned on subsequent calls.
+# One cache entry for everything means Streamlit hashes and stores the datasets
+# once instead of ten separate times.
+# The cache only lives in memory on purpose: Streamlit's cache key doesn't
+# change when the CSV files or the reading options change, so a copy kept on
+# disk could go stale. Fast cold starts come from the Parquet copies instead
+# (see _load_cached() above), which are checked against the CSV files.
+#
+# The load_*() functions below are kept for code that needs a single dataset.
+
+def _drop_missing_medal_types(medals):
+    """Drop medal records without a medal type."""
+    # A medal record without a medal type can't be counted anywhere, so drop it here once
+    return medals.dropna(subset=['medal_type'])
+
+
+def _convert_schedule_to_paris_time(schedule):
+    """Convert the schedule start/end timestamps to Paris local time."""
+    # The pyarrow parser reads timestamps like "2024-07-24T15:00:00+02:00" as UTC
+    # Convert them back to Paris time so the pages show the local start times
+    for col in ['start_date', 'end_date']:
+        schedule[col] = schedule[col].dt.tz_convert('Europe/Paris')
+    return schedule
+
+
+# Extra clean-up step for the datasets that need one, applied right after reading
+DATASET_FIXES = {
+    'medals': _drop_missing_medal_types,
+    'schedule': _convert_schedule_to_paris_time,
+}
+
+
+def _read_dataset(name):
+    """
+    Read one dataset, store its text as Arrow strings and apply its clean-up
+    step from DATASET_FIXES (if any).
+    
+    Args:
+        name: Dataset key from DATASET_FILES (e.g. 'athletes')
+    
+    Returns:
+        DataFrame with the dataset contents
+    """
+    # _load_cached() returns the file as a pandas DataFrame, reading the fast
+    # Parquet copy when one exists and falling back to parsing the CSV otherwise
+    df = _use_arrow_strings(_load_cached(name))
+    fix = DATASET_FIXES.get(name)
+    return fix(df) if fix else df
+
+
+#using the streamlit cache function for the csv reads to prevent the reload after each user action
+# The function takes no arguments, so max_entries=1 is all it will ever need
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_all_frames():
+    """
+    Read every dataset in DATASET_FILES, in parallel.
+    
+    Returns:
+        dict: {dataset name: DataFrame}, with the raw (not yet enriched) datasets
+    """
+    # Each read mostly waits on disk I/O and on the pyarrow reader, which both
+    # release the GIL, so we run them all at once in a small thread pool instead
+    # of one after the other. The workers only run plain (uncached) functions,
+    # so they don't need access to the Streamlit session.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {name: executor.submit(_read_dataset, name) for name in DATASET_FILES}
+        # .result() waits for each read to finish (and re-raises any error it hit)
+        return {name: future.result() for name, future in futures.items()}
+
 
-#using the streamlit cache function for every csv read to prevent the reload after each user action
-@st.cache_data
 def load_athletes():
     """Load the athletes.csv file containing information about all athletes."""
-    # pd.read_csv() reads a CSV file into a pandas DataFrame
-    # os.path.join() safely combines the DATA_PATH with the filename
-    return pd.read_csv(os.path.join(DATA_PATH, "athletes.csv"))
+    return _load_all_frames()['athletes']
 
-@st.cache_data
 def load_coaches():
     """Load the coaches.csv file containing information about coaches."""
-    return pd.read_csv(os.path.join(DATA_PATH, "coaches.csv"))
+    return _load_all_frames()['coaches']
 
-@st.cache_data
 def load_events():
     """Load the events.csv file containing information about all Olympic events."""
-    return pd.read_csv(os.path.join(DATA_PATH, "events.csv"))
+    return _load_all_frames()['events']
 
-@st.cache_data
 def load_medals():
     """Load the medals.csv file containing detailed records of each medal awarded."""
-    return pd.read_csv(os.path.join(DATA_PATH, "medals.csv"))
+    return _load_all_frames()['medals']
 
-@st.cache_data
 def load_medals_total():
     """Load the medals_total.csv file with aggregated medal counts per country."""
-    return pd.read_csv(os.path.join(DATA_PATH, "medals_total.csv"))
+    return _load_all_frames()['medals_total']
 
-@st.cache_data
 def load_medalists():
     """Load the medallists.csv file with information about medal-winning athletes."""
-    return pd.read_csv(os.path.join(DATA_PATH, "medallists.csv"))
+    return _load_all_frames()['medalists']
 
-@st.cache_data
 def load_nocs():
     """Load the nocs.csv file containing National Olympic Committee information."""
-    return pd.read_csv(os.path.join(DATA_PATH, "nocs.csv"))
+    return _load_all_frames()['nocs']
 
-@st.cache_data
 def load_schedule():
     """Load the schedules.csv file containing the event schedule."""
-    return pd.read_csv(os.path.join(DATA_PATH, "schedules.csv"))
+    return _load_all_frames()['schedule']
 
-@st.cache_data
 def load_teams():
     """Load the teams.csv file containing team information."""
-    return pd.read_csv(os.path.join(DATA_PATH, "teams.csv"))
+    return _load_all_frames()['teams']
 
-@st.cache_data
 def load_venues():
     """Load the venues.csv file containing venue information."""
-    return pd.read_csv(os.path.join(DATA_PATH, "venues.csv"))
-
-# =============================================================================
-# CONTINENT MAPPING
-# =============================================================================
-# The raw data doesn't include continent information for countries.
-# This function provides a mapping from IOC country codes to continent names.
-# This allows us to group and filter countries by continent in the dashboard.
-
-@st.cache_data
-def get_continent_mapping():
-    """
-    Returns a dictionary mapping IOC country codes to their continents.
-    This is manually maintained since the Olympics data doesn't include continents.
-    """
-    continent_map = {
-        # Europe - Western, Eastern, Northern, and Southern European countries
-        'ALB': 'Europe', 'AND': 'Europe', 'ARM': 'Europe', 'AUT': 'Europe', 'AZE': 'Europe',
-        'BLR': 'Europe', 'BEL': 'Europe', 'BIH': 'Europe', 'BUL': 'Europe', 'CRO': 'Europe',
-        'CYP': 'Europe', 'CZE': 'Europe', 'DEN': 'Europe', 'ESP': 'Europe', 'EST': 'Europe',
-        'FIN': 'Europe', 'FRA': 'Europe', 'GBR': 'Europe', 'GEO': 'Europe', 'GER': 'Europe',
-        'GRE': 'Europe', 'HUN': 'Europe', 'IRL': 'Europe', 'ISL': 'Europe', 'ISR': 'Europe',
-        'ITA': 'Europe', 'KOS': 'Europe', 'LAT': 'Europe', 'LIE': 'Europe', 'LTU': 'Europe',
-        'LUX': 'Europe', 'MDA': 'Europe', 'MKD': 'Europe', 'MLT': 'Europe', 'MNE': 'Europe',
-        'NED': 'Europe', 'NOR': 'Europe', 'POL': 'Europe', 'POR': 'Europe', 'ROU': 'Europe',
-        'SRB': 'Europe', 'SVK': 'Europe', 'SLO': 'Europe', 'SUI': 'Europe', 'SWE': 'Europe',
-        'TUR': 'Europe', 'UKR': 'Europe', 'SMR': 'Europe', 'MON': 'Europe',
-        
-        # Asia - East, Southeast, South, Central, and West Asian countries
-        'AFG': 'Asia', 'BRN': 'Asia', 'BAN': 'Asia', 'BHU': 'Asia', 'BRU': 'Asia',
-        'CAM': 'Asia', 'CHN': 'Asia', 'TPE': 'Asia', 'IND': 'Asia', 'INA': 'Asia',
-        'IRI': 'Asia', 'IRQ': 'Asia', 'JPN': 'Asia', 'JOR': 'Asia', 'KAZ': 'Asia',
-        'KOR': 'Asia', 'KUW': 'Asia', 'KGZ': 'Asia', 'LAO': 'Asia', 'LBN': 'Asia',
-        'MAS': 'Asia', 'MDV': 'Asia', 'MGL': 'Asia', 'MYA': 'Asia', 'NEP': 'Asia',
-        'OMA': 'Asia', 'PAK': 'Asia', 'PLE': 'Asia', 'PHI': 'Asia', 'QAT': 'Asia',
-        'KSA': 'Asia', 'SGP': 'Asia', 'SRI': 'Asia', 'SYR': 'Asia', 'TJK': 'Asia',
-        'THA': 'Asia', 'TLS': 'Asia', 'TKM': 'Asia', 'UAE': 'Asia', 'UZB': 'Asia',
-        'VIE': 'Asia', 'YEM': 'Asia', 'HKG': 'Asia', 'PRK': 'Asia',
-        
-        # Africa - North, West, East, Central, and Southern African countries
-        'ALG': 'Africa', 'ANG': 'Africa', 'BEN': 'Africa', 'BOT': 'Africa', 'BUR': 'Africa',
-        'BDI': 'Africa', 'CMR': 'Africa', 'CPV': 'Africa', 'CAF': 'Africa', 'CHA': 'Africa',
-        'COM': 'Africa', 'CGO': 'Africa', 'CIV': 'Africa', 'COD': 'Africa', 'DJI': 'Africa',
-        'EGY': 'Africa', 'GEQ': 'Africa', 'ERI': 'Africa', 'ETH': 'Africa', 'GAB': 'Africa',
-        'GAM': 'Africa', 'GHA': 'Africa', 'GUI': 'Africa', 'GBS': 'Africa', 'KEN': 'Africa',
-        'LES': 'Africa', 'LBR': 'Africa', 'LBA': 'Africa', 'MAD': 'Africa', 'MAW': 'Africa',
-        'MLI': 'Africa', 'MRI': 'Africa', 'MAR': 'Africa', 'MOZ': 'Africa', 'NAM': 'Africa',
-        'NIG': 'Africa', 'NGR': 'Africa', 'RWA': 'Africa', 'STP': 'Africa', 'SEN': 'Africa',
-        'SEY': 'Africa', 'SLE': 'Africa', 'SOM': 'Africa', 'RSA': 'Africa', 'SSD': 'Africa',
-        'SUD': 'Africa', 'TAN': 'Africa', 'TOG': 'Africa', 'TUN': 'Africa', 'UGA': 'Africa',
-        'ZAM': 'Africa', 'ZIM': 'Africa',
-        
-        # North America - Including Central America and Caribbean nations
-        'ANT': 'North America', 'ARU': 'North America', 'BAH': 'North America', 'BAR': 'North America',
-        'BIZ': 'North America', 'BER': 'North America', 'CAN': 'North America', 'CAY': 'North America',
-        'CRC': 'North America', 'CUB': 'North America', 'DMA': 'North America', 'DOM': 'North America',
-        'ESA': 'North America', 'GRN': 'North America', 'GUA': 'North America', 'HAI': 'North America',
-        'HON': 'North America', 'JAM': 'North America', 'MEX': 'North America', 'NCA': 'North America',
-        'PAN': 'North America', 'PUR': 'North America', 'SKN': 'North America', 'LCA': 'North America',
-        'VIN': 'North America', 'TTO': 'North America', 'USA': 'North America', 'ISV': 'North America',
-        
-        # South America
-        'ARG': 'South America', 'BOL': 'South America', 'BRA': 'South America', 'CHI': 'South America',
-        'COL': 'South America', 'ECU': 'South America', 'GUY': 'South America', 'PAR': 'South America',
-        'PER': 'South America', 'SUR': 'South America', 'URU': 'South America', 'VEN': 'South America',
-        
-        # Oceania - Australia, New Zealand, and Pacific Island nations
-        'ASA': 'Oceania', 'AUS': 'Oceania', 'COK': 'Oceania', 'FIJ': 'Oceania', 'FSM': 'Oceania',
-        'GUM': 'Oceania', 'KIR': 'Oceania', 'MHL': 'Oceania', 'NRU': 'Oceania', 'NZL': 'Oceania',
-        'PLW': 'Oceania', 'PNG': 'Oceania', 'SAM': 'Oceania', 'SOL': 'Oceania', 'TGA': 'Oceania',
-        'TUV': 'Oceania', 'VAN': 'Oceania',
-    }
-    return continent_map
+    return _load_all_frames()['venues']
 
 # =============================================================================
 # LOAD ALL DATA AT ONCE
 # =============================================================================
 # This function loads all datasets and returns them in a single dictionary.
 # This is the main function that pages should call to get their data.
+# It's cached the same way as _load_all_frames(): in memory only (so the
+# freshness checks of the bundle run again after every restart) and limited
+# to its one (argument-less) entry
 
-@st.cache_data
+@st.cache_data(max_entries=1, show_spinner=False)
 def load_all_data():
     """
     Load all CSV datasets and return them in a dictionary.
     Also enriches the NOCs data with continent information.
     
+    If an up-to-date bundle built by utils/build_cache.py exists, the final
+    DataFrames are read straight from it instead of being built again.
+    
     Returns:
         dict: A dictionary where keys are dataset names and values are DataFrames.
               Keys: 'athletes', 'coaches', 'events', 'medals', 'medals_total',
                     'medalists', 'nocs', 'schedule', 'teams', 'venues'
     """
-    # Load the datasets we need to process
-    athletes = load_athletes()
-    medals_total = load_medals_total()
-    nocs = load_nocs()
+    bundle = _load_bundle()
+    if bundle is not None:
+        return bundle
+    return build_all_data()
+
 
-    # Get the continent mapping dictionary
-    continent_map = get_continent_mapping()
+def _load_bundle():
+    """
+    Read every dataset from the prebuilt bundle in BUNDLE_PATH.
     
-    # Add a 'continent' column to the NOCs DataFrame
-    # .map() looks up each 'code' value in the continent_map dictionary
-    # If a code isn't found, it returns NaN, which we fill with 'Other'
-    nocs['continent'] = nocs['code'].map(continent_map).fillna('Other')
-    #adding the continents attribute to the nocs dataframe by using the code to continet map
-    #filling empty values with Other
+    Returns:
+        dict of DataFrames (same keys as load_all_data()), or None if the bundle
+        is missing, incomplete, written in another format (see BUNDLE_FORMAT_KEY),
+        or older than its CSV file or this module
+    """
+    if not os.path.isdir(BUNDLE_PATH):
+        return None
     
-    # Return all datasets in a dictionary for easy access
-    return {
-        'athletes': athletes,
-        'coaches': load_coaches(),
-        'events': load_events(),
-        'medals': load_medals(),
-        'medals_total': medals_total,
-        'medalists': load_medalists(),
-        'nocs': nocs,  # This now includes the continent column
-        'schedule': load_schedule(),
-        'teams': load_teams(),
-        'venues': load_venues(),
-    }
+    bundle = {}
+    for name, bundle_file in BUNDLE_FILES.items():
+        # Same freshness rule as the per-file Parquet cache in _load_cached(),
+        # plus utils/core.py, whose CONTINENT_MAP decides the continent columns.
+        # A bundle built by other code or pandas/pyarrow versions has another
+        # file name, so it doesn't exist here
+        source_mtime = max(os.path.getmtime(CSV_PATHS[name]),
+                           os.path.getmtime(__file__),
+                           os.path.getmtime(core.__file__))
+        if not os.path.exists(bundle_file) or os.path.getmtime(bundle_file) < source_mtime:
+            return None
+        bundle[name] = _use_arrow_strings(pd.read_parquet(bundle_file, engine="pyarrow"))
+    return bundle
 
-# =============================================================================
-# FILTER FUNCTION
-# =============================================================================
-# This function applies user-selected filters to a DataFrame.
-# It's used throughout the dashboard to filter data based on sidebar selections.
 
-def apply_filters(data, filters):
+def build_all_data():
     """
-    Apply user-selected filters to a DataFrame.
+    Load every dataset from the CSV files (or their Parquet copies) and prepare it.
     
-    This function takes a DataFrame and a dictionary of filter selections,
-    then returns a filtered copy of the DataFrame based on those selections.
-    
-    Args:
-        data: A pandas DataFrame to filter
-        filters: A dictionary with keys like 'countries', 'sports', 'medal_types', 'continents'
-                Each value is a list of selected values for that filter.
-                Empty list means no filter is applied for that category.
+    This does the actual work behind load_all_data(). It isn't cached itself,
+    so pages should call load_all_data(); utils/build_cache.py calls this
+    directly to write the bundle.
     
     Returns:
-        A filtered copy of the input DataFrame
+        dict: Same dictionary of DataFrames as load_all_data()
     """
-    #the filter works here by taking the full dataframe and a dictionary of selected filters
-    #then show only the data pertinent to the selected filters
-    
-    # Make a copy so we don't modify the original DataFrame
-    df = data.copy()
-
-    # Apply country filter if countries are selected
-    if filters.get('countries'):
-        # Check which column name the DataFrame uses for country codes
-        if 'country_code' in df.columns:
-            # .isin() returns True for rows where the value is in the provided list
-            # We use this as a boolean mask to filter the DataFrame
-            df = df[df['country_code'].isin(filters['countries'])]
-            #keeping the rows whome country code is in the filters of countries list
-        elif 'code' in df.columns:
-            # Some DataFrames use 'code' instead of 'country_code'
-            df = df[df['code'].isin(filters['countries'])]
-    
-    # Apply sport filter if sports are selected and the column exists
-    #if the filter of sports is applied and the sport is in the current dataframe     
-    if filters.get('sports') and 'sport' in df.columns:
-        df = df[df['sport'].isin(filters['sports'])]
+    # Read all the datasets (cached, see _load_all_frames above)
+    all_data = _load_all_frames()
 
-    # Apply medal type filter
-    if filters.get('medal_types') and 'medal_type' in df.columns:
-        df = df[df['medal_type'].isin(filters['medal_types'])]
+    # Add a 'continent' column to the NOCs DataFrame
+    # Since 'code' is categorical (see CATEGORY_COLUMNS), we only look up each
+    # distinct code once in the CONTINENT_MAP dictionary (codes that aren't found become 'Other'), then
+    # spread the results to all rows with the integer category codes.
+    # The extra 'Other' at the end is picked by missing codes, whose category code is -1
+    nocs = all_data['nocs']
+    code_categories = nocs['code'].cat.categories
+    continent_lookup = np.array(
+        [CONTINENT_MAP.get(code, 'Other') for code in code_categories] + ['Other'],
+        dtype=object,
+    )
+    nocs['continent'] = continent_lookup[nocs['code'].cat.codes.to_numpy()]
+    #adding the continents attribute to the nocs dataframe by using the code to continet map
+    #filling empty values with Other
+    # Store the new text column as Arrow strings too, like every other text column
+    _use_arrow_strings(nocs)
 
-    # Apply continent filter
-    if filters.get('continents') and 'continent' in df.columns:
-        df = df[df['continent'].isin(filters['continents'])]
+    # Copy the continent onto every per-country table the pages filter or group
+    # by continent, so they don't each have to merge with nocs themselves.
+    # Same trick as above: one dictionary lookup per distinct country code.
+    # Codes that aren't in nocs get NaN, just like the old left merges gave them
+    noc_continents = dict(zip(nocs['code'], nocs['continent']))
+    for name in ['athletes', 'medals', 'medalists', 'medals_total']:
+        df = all_data[name]
+        country_codes = df['country_code']
+        continent_lookup = np.array(
+            [noc_continents.get(code, np.nan) for code in country_codes.cat.categories] + [np.nan],
+            dtype=object,
+        )
+        df['continent'] = continent_lookup[country_codes.cat.codes.to_numpy()]
+        _use_arrow_strings(df)
 
-    return df
+    return all_data
@@ -14,6 +14,55 @@
 
 import streamlit as st  # The main framework for building the filter UI
 from utils.country_flags import get_flag_html  # For displaying country flags
+from utils.core import ALL_MEDAL_TYPES, MEDAL_TYPES  # The medal types, defined once for all modules
+
+
+# Filter keys and the words used for them in get_filter_summary(), in the
+# order they appear in the summary
+_SUMMARY_LABELS = (
+    ('countries', 'countries'),
+    ('continents', 'continents'),
+    ('sports', 'sports'),
+    ('medal_types', 'medal types'),
+)
+
+# How many flags of selected countries to show in the sidebar at most
+MAX_FLAGS_SHOWN = 30
+
+# Every possible selection of the three checkboxes, built once. The checked boxes
+# are turned into a bitmask (gold = 1, silver = 2, bronze = 4) that indexes this
+# tuple, so the same selection always returns the same shared tuple instead of
+# a new list on every rerun.
+_MEDAL_TYPE_COMBOS = tuple(
+    tuple(medal for bit, medal in enumerate(MEDAL_TYPES) if mask & (1 << bit))
+    for mask in range(1 << len(MEDAL_TYPES))
+)
+
+
+# The dataset never changes while the app runs, so the option lists are built
+# once and reused on every rerun (each click on a widget reruns the whole page).
+# The underscore in the argument names tells Streamlit not to hash the DataFrames,
+# so the cache key is just the function itself.
+@st.cache_data(show_spinner=False)
+def get_filter_options(_nocs, _events):
+    """
+    Build the sorted option lists for the sidebar filters.
+    
+    Args:
+        _nocs: NOCs DataFrame (with the 'continent' column from load_all_data())
+        _events: Events DataFrame
+    
+    Returns:
+        dict: Tuples of options for 'countries', 'continents' and 'sports'
+    """
+    return {
+        # .unique() returns distinct values, sorted() puts them in order
+        'countries': tuple(sorted(_nocs['code'].unique().tolist())),
+        # We added the continent column in data_loader
+        'continents': tuple(sorted(_nocs['continent'].unique().tolist())),
+        # .dropna() removes any missing (NaN) values from the list
+        'sports': tuple(sorted(_events['sport'].dropna().unique().tolist())),
+    }
 
 def create_sidebar_filters(data):
     """
@@ -32,7 +81,7 @@ def create_sidebar_filters(data):
             - 'countries': List of selected country codes (empty if none selected)
             - 'continents': List of selected continent names
             - 'sports': List of selected sport names
-            - 'medal_types': List of selected medal types (e.g., ['Gold Medal'])
+            - 'medal_types': Tuple of selected medal types (e.g., ('Gold Medal',))
     """
     # st.sidebar gives us access to the sidebar area of the Streamlit app
     # Anything called with st.sidebar.X appears in the sidebar instead of main area
@@ -44,16 +93,17 @@ def create_sidebar_filters(data):
     # Initialize the filters dictionary to store user selections
     filters = {}
     
+    # Sorted option lists for the dropdowns (computed once, see get_filter_options)
+    options = get_filter_options(data['nocs'], data['events'])
+    
     # ==========================================================================
     # COUNTRY FILTER (MULTI-SELECT DROPDOWN)
     # ==========================================================================
     #creating subheaders for each filter
     st.sidebar.subheader("🌍 Country (NOC)")
     
-    # Get all unique country codes from the NOCs data, sorted alphabetically
-    # .unique() returns distinct values, sorted() puts them in order
-    # .tolist() converts from numpy array to Python list
-    all_countries = sorted(data['nocs']['code'].unique().tolist())
+    # All unique country codes from the NOCs data, sorted alphabetically
+    all_countries = options['countries']
     # The 'code' attribute is a column directly within the 'nocs' DataFrame,
     # representing the NOC code for each entry.
     
@@ -67,8 +117,15 @@ def create_sidebar_filters(data):
     )
     
     # Display selected countries with their flags (if any are selected)
+    # get_flag_html() is cached, so each flag's HTML is only built once.
+    # Only the first MAX_FLAGS_SHOWN flags are drawn, so selecting a long list
+    # of countries doesn't fill the sidebar with hundreds of images
     if filters['countries']:
-        flags_html = " ".join([f"{get_flag_html(c, 20)}" for c in filters['countries']])
+        shown = filters['countries'][:MAX_FLAGS_SHOWN]
+        flags_html = " ".join([get_flag_html(c, 20) for c in shown])
+        hidden = len(filters['countries']) - len(shown)
+        if hidden > 0:
+            flags_html += f" (+{hidden} more)"
         st.sidebar.markdown(f"Selected: {flags_html}", unsafe_allow_html=True)
     
     # ==========================================================================
@@ -76,8 +133,8 @@ def create_sidebar_filters(data):
     # ==========================================================================
     st.sidebar.subheader("🗺️ Continent")
     
-    # Get unique continents from the NOCs data (we added this column in data_loader)
-    all_continents = sorted(data['nocs']['continent'].unique().tolist())
+    # Unique continents from the NOCs data (we added this column in data_loader)
+    all_continents = options['continents']
     
     filters['continents'] = st.sidebar.multiselect(
         "Select Continents",
@@ -91,9 +148,8 @@ def create_sidebar_filters(data):
     # ==========================================================================
     st.sidebar.subheader("⚽ Sport")
     
-    # Get unique sports from the events data
-    # .dropna() removes any missing (NaN) values from the list
-    all_sports = sorted(data['events']['sport'].dropna().unique().tolist())
+    # Unique sports from the events data
+    all_sports = options['sports']
     
     filters['sports'] = st.sidebar.multiselect(
         "Select Sports",
@@ -107,9 +163,6 @@ def create_sidebar_filters(data):
     # ==========================================================================
     st.sidebar.subheader("🏅 Medal Type")
     
-    # Define the valid medal types
-    medal_types = ['Gold Medal', 'Silver Medal', 'Bronze Medal']
-    
     # Create three columns in the sidebar for the medal checkboxes
     # This arranges them horizontally instead of vertically
     col1, col2, col3 = st.sidebar.columns(3)
@@ -124,14 +177,8 @@ def create_sidebar_filters(data):
     with col3:
         bronze = st.checkbox("🥉", value=True, help="Bronze")
     
-    # Build the medal_types list based on which checkboxes are checked
-    filters['medal_types'] = []
-    if gold:
-        filters['medal_types'].append('Gold Medal')
-    if silver:
-        filters['medal_types'].append('Silver Medal')
-    if bronze:
-        filters['medal_types'].append('Bronze Medal')
+    # Look up the tuple of checked medal types (see _MEDAL_TYPE_COMBOS above)
+    filters['medal_types'] = _MEDAL_TYPE_COMBOS[gold | silver << 1 | bronze << 2]
     
     st.sidebar.markdown("---")
     
@@ -167,21 +214,17 @@ def get_filter_summary(filters):
     
     # Check each filter type and add a summary if selections exist
     # filters.get('key') returns the value or None if key doesn't exist
-    
-    if filters.get('countries'):
-        # len() gives the number of selected countries
-        summaries.append(f"{len(filters['countries'])} countries")
-    
-    if filters.get('continents'):
-        summaries.append(f"{len(filters['continents'])} continents")
-    
-    if filters.get('sports'):
-        summaries.append(f"{len(filters['sports'])} sports")
-    
-    # For medal types, only mention them if not all three are selected
-    # (since all three selected is the same as no filter)
-    if filters.get('medal_types') and len(filters['medal_types']) < 3:
-        summaries.append(f"{len(filters['medal_types'])} medal types")
+    for key, label in _SUMMARY_LABELS:
+        selected = filters.get(key)
+        if not selected:
+            continue
+        # For medal types, only mention them if not all three are selected
+        # (since all three selected is the same as no filter - the same check
+        # as in apply_filters())
+        if key == 'medal_types' and frozenset(selected) >= ALL_MEDAL_TYPES:
+            continue
+        # len() gives the number of selected values
+        summaries.append(f"{len(selected)} {label}")
     
     # Build the final summary string
     if summaries:
@@ -13,6 +13,9 @@
 # 30% differ. This dictionary contains all Olympic countries and their mappings.
 # =============================================================================
 
+from types import MappingProxyType  # For the read-only mappings
+import pandas as pd  # For the column-wide conversion in to_iso_series()
+
 # The main mapping dictionary from IOC codes to ISO codes
 # Keys are IOC codes (used in the Olympics data)
 # Values are ISO 3166-1 alpha-3 codes (used by Plotly maps)
@@ -27,13 +30,8 @@ IOC_TO_ISO = {
     'AND': 'AND',  # Andorra
     'ANG': 'AGO',  # Angola
     
-    # Note about ANT: This is Antigua and Barbuda (ATG in ISO)
-    # The old ANT code was for Netherlands Antilles which no longer exists
-    'ANT': 'ATG', # Antigua and Barbuda (Note: ANT was Neth Antilles, but often confused. Check dataset.)
-    # Actually, ANT in dataset is "Antigua and Barbuda" -> ATG.
-    # Wait, let's check nocs.csv for ANT.
-    # ANT,Antigua and Barbuda,Antigua and Barbuda,antigua-and-barbuda,P
-    # So ANT -> ATG.
+    # ANT is Antigua and Barbuda in nocs.csv (not the former Netherlands Antilles)
+    'ANT': 'ATG',  # Antigua and Barbuda
     
     'ARG': 'ARG',  # Argentina
     'ARM': 'ARM',  # Armenia
@@ -237,11 +235,21 @@ IOC_TO_ISO = {
     'ZIM': 'ZWE',  # Zimbabwe
     
     # Historical / Special codes for Olympic teams that aren't countries
-    'EOR': 'EOR', # Refugee Olympic Team - No ISO, usually handled specially or mapped to something else?
-    'ROC': 'RUS', # Russian Olympic Committee -> Russia
-    'AIN': 'AIN', # Individual Neutral Athletes -> No ISO
+    'EOR': 'EOR',  # Refugee Olympic Team - no ISO code
+    'ROC': 'RUS',  # Russian Olympic Committee -> Russia
+    'AIN': 'AIN',  # Individual Neutral Athletes - no ISO code
 }
 
+# Read-only view, so no page can modify the shared mapping by accident
+IOC_TO_ISO = MappingProxyType(IOC_TO_ISO)
+
+# The reverse mapping, from ISO codes back to IOC codes (e.g. for a country
+# clicked on a choropleth map). A few IOC codes share an ISO code ('ROC' and
+# 'RUS' are both 'RUS'); the first one in IOC_TO_ISO wins, which is the
+# country's own code since the special teams are listed last. Going through the
+# items in reverse lets the earlier entries overwrite the later ones.
+ISO_TO_IOC = MappingProxyType({iso: ioc for ioc, iso in reversed(IOC_TO_ISO.items())})
+
 
 def get_iso_code(ioc_code):
     """
@@ -267,3 +275,43 @@ def get_iso_code(ioc_code):
     # The second argument is the default value if the key isn't found
     # We return the original code as a fallback for unmapped codes
     return IOC_TO_ISO.get(ioc_code, ioc_code)
+
+
+def get_ioc_code(iso_code):
+    """
+    Convert an ISO 3166-1 alpha-3 code back to an IOC country code.
+    
+    This is the reverse of get_iso_code().
+    
+    Args:
+        iso_code: The ISO country code (e.g., 'DEU', 'CHE', 'USA')
+    
+    Returns:
+        The corresponding IOC code (e.g., 'GER', 'SUI', 'USA'),
+        or the original code if no mapping exists.
+    """
+    return ISO_TO_IOC.get(iso_code, iso_code)
+
+
+def to_iso_series(ioc_codes):
+    """
+    Convert a whole column of IOC country codes to ISO 3166-1 alpha-3 codes.
+    
+    Use this instead of df['country_code'].apply(get_iso_code) when preparing
+    a DataFrame for a choropleth map: .map() with a dictionary looks up the
+    whole column at once instead of calling a Python function for every row.
+    
+    Args:
+        ioc_codes: pandas Series of IOC country codes
+    
+    Returns:
+        pandas Series of ISO codes, keeping the original code wherever no
+        mapping exists (same rule as get_iso_code)
+    """
+    iso_codes = ioc_codes.map(IOC_TO_ISO)
+    # On a categorical column .map() may return another categorical, which can't
+    # be filled with codes that aren't among its categories, so use plain values
+    if isinstance(iso_codes.dtype, pd.CategoricalDtype):
+        iso_codes = iso_codes.astype(object)
+    # Codes without a mapping come back as NaN: fall back to the original code
+    return iso_codes.fillna(ioc_codes)
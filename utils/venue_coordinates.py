@@ -9,76 +9,165 @@
 # The venues.csv file may not include coordinates, so we provide them here.
 # =============================================================================
 
+import math  # For converting a single coordinate to radians
+import re  # For stripping punctuation from venue names
+from functools import lru_cache  # For caching the venue lookups
+import unicodedata  # For removing accents from venue names
+from types import MappingProxyType  # For the read-only venue table
+import numpy as np  # For the latitude/longitude arrays
+
 # Dictionary of venue coordinates
-# Keys are venue names (must match exactly what appears in the schedule data)
-# Values are dictionaries with 'lat' (latitude) and 'lon' (longitude)
+# Keys are venue names as they appear in the schedule data. Lookups ignore case,
+# accents and punctuation (see _normalize_venue_name below), so spelling
+# variants like "Champ-de-Mars Arena" / "Champ de Mars Arena" need only one entry
+# Values are (latitude, longitude) tuples
 # Latitude: positive = North, negative = South
 # Longitude: positive = East, negative = West
 VENUE_COORDINATES = {
     # Major Paris venues
-    "Aquatics Centre": {"lat": 48.9244, "lon": 2.3600},  # Swimming, diving, water polo
-    "Bercy Arena": {"lat": 48.8386, "lon": 2.3785},  # Gymnastics, basketball
-    "Bordeaux Stadium": {"lat": 44.8969, "lon": -0.5639},  # Football matches (outside Paris)
-    "Champ de Mars Arena": {"lat": 48.8530, "lon": 2.3012},  # Judo, wrestling
-    "Château de Versailles": {"lat": 48.8049, "lon": 2.1204},  # Equestrian, modern pentathlon
-    "Chateauroux Shooting Centre": {"lat": 46.8115, "lon": 1.7534},  # Shooting sports
+    "Aquatics Centre": (48.9244, 2.3600),  # Swimming, diving, water polo
+    "Bercy Arena": (48.8386, 2.3785),  # Gymnastics, basketball
+    "Bordeaux Stadium": (44.8969, -0.5639),  # Football matches (outside Paris)
+    "Champ de Mars Arena": (48.8530, 2.3012),  # Judo, wrestling
+    "Château de Versailles": (48.8049, 2.1204),  # Equestrian, modern pentathlon
+    "Chateauroux Shooting Centre": (46.8115, 1.7534),  # Shooting sports
     
     # Iconic Paris locations
-    "Eiffel Tower Stadium": {"lat": 48.8584, "lon": 2.2945},  # Beach volleyball
-    "Elancourt Hill": {"lat": 48.7708, "lon": 1.9667},  # Mountain biking
-    "Geoffroy-Guichard Stadium": {"lat": 45.4608, "lon": 4.3903},  # Football (Saint-Étienne)
-    "Grand Palais": {"lat": 48.8661, "lon": 2.3125},  # Fencing, taekwondo
-    "Hôtel de Ville": {"lat": 48.8566, "lon": 2.3522},  # Paris City Hall - marathon finish
-    "Invalides": {"lat": 48.8622, "lon": 2.3125},  # Archery, road cycling start/finish
+    "Eiffel Tower Stadium": (48.8584, 2.2945),  # Beach volleyball
+    "Elancourt Hill": (48.7708, 1.9667),  # Mountain biking
+    "Geoffroy-Guichard Stadium": (45.4608, 4.3903),  # Football (Saint-Étienne)
+    "Grand Palais": (48.8661, 2.3125),  # Fencing, taekwondo
+    "Hôtel de Ville": (48.8566, 2.3522),  # Paris City Hall - marathon finish
+    "Invalides": (48.8622, 2.3125),  # Archery, road cycling start/finish
     
     # More Paris venues
-    "La Beaujoire Stadium": {"lat": 47.2556, "lon": -1.5253},  # Football (Nantes)
-    "La Concorde": {"lat": 48.8656, "lon": 2.3212},  # 3x3 basketball, BMX, skateboarding, breaking
-    "Le Bourget Sport Climbing Venue": {"lat": 48.9394, "lon": 2.4250},  # Sport climbing
-    "Golf National": {"lat": 48.7547, "lon": 2.0744},  # Golf
-    "Lyon Stadium": {"lat": 45.7653, "lon": 4.9820},  # Football
+    "La Beaujoire Stadium": (47.2556, -1.5253),  # Football (Nantes)
+    "La Concorde": (48.8656, 2.3212),  # 3x3 basketball, BMX, skateboarding, breaking
+    "Le Bourget Sport Climbing Venue": (48.9394, 2.4250),  # Sport climbing
+    "Golf National": (48.7547, 2.0744),  # Golf
+    "Lyon Stadium": (45.7653, 4.9820),  # Football
     
     # Marseille venues (sailing)
-    "Marseille Marina": {"lat": 43.2700, "lon": 5.3692},  # Sailing events
-    "Marseille Stadium": {"lat": 43.2699, "lon": 5.3959},  # Football matches
+    "Marseille Marina": (43.2700, 5.3692),  # Sailing events
+    "Marseille Stadium": (43.2699, 5.3959),  # Football matches
     
     # Other regional venues
-    "Nice Stadium": {"lat": 43.7056, "lon": 7.1925},  # Football
-    "North Paris Arena": {"lat": 48.9719, "lon": 2.4861},  # Boxing, modern pentathlon (fencing)
-    "Parc des Princes": {"lat": 48.8414, "lon": 2.2530},  # Football
-    "Paris La Defense Arena": {"lat": 48.8958, "lon": 2.2297},  # Swimming, water polo
-    "Pierre Mauroy Stadium": {"lat": 50.6119, "lon": 3.1305},  # Basketball (Lille), handball
-    "Pont Alexandre III": {"lat": 48.8639, "lon": 2.3136},  # Triathlon, open water swimming
-    "Porte de La Chapelle Arena": {"lat": 48.8994, "lon": 2.3611},  # Badminton, rhythmic gymnastics
+    "Nice Stadium": (43.7056, 7.1925),  # Football
+    "North Paris Arena": (48.9719, 2.4861),  # Boxing, modern pentathlon (fencing)
+    "Parc des Princes": (48.8414, 2.2530),  # Football
+    "Paris La Defense Arena": (48.8958, 2.2297),  # Swimming, water polo
+    "Pierre Mauroy Stadium": (50.6119, 3.1305),  # Basketball (Lille), handball
+    "Pont Alexandre III": (48.8639, 2.3136),  # Triathlon, open water swimming
+    "Porte de La Chapelle Arena": (48.8994, 2.3611),  # Badminton, rhythmic gymnastics
     
     # Tennis and more
-    "Stade Roland-Garros": {"lat": 48.8473, "lon": 2.2494},  # Tennis, boxing
-    "Saint-Quentin-en-Yvelines BMX Stadium": {"lat": 48.7844, "lon": 2.0311},  # BMX racing
-    "Saint-Quentin-en-Yvelines Velodrome": {"lat": 48.7844, "lon": 2.0311},  # Track cycling
-    "South Paris Arena": {"lat": 48.8322, "lon": 2.2856},  # Handball, volleyball, table tennis
-    "Stade de France": {"lat": 48.9245, "lon": 2.3602},  # Athletics, rugby sevens
+    "Stade Roland-Garros": (48.8473, 2.2494),  # Tennis, boxing
+    "Saint-Quentin-en-Yvelines BMX Stadium": (48.7844, 2.0311),  # BMX racing
+    "Saint-Quentin-en-Yvelines Velodrome": (48.7844, 2.0311),  # Track cycling
+    "South Paris Arena": (48.8322, 2.2856),  # Handball, volleyball, table tennis
+    "Stade de France": (48.9245, 2.3602),  # Athletics, rugby sevens
     
     # Special locations
-    "Teahupo'o, Tahiti": {"lat": -17.8472, "lon": -149.2667},  # Surfing (French Polynesia!)
-    "Trocadéro": {"lat": 48.8616, "lon": 2.2893},  # Road cycling, marathon
-    "Vaires-sur-Marne Nautical Stadium": {"lat": 48.8625, "lon": 2.6378},  # Rowing, canoe/kayak
-    "Yves-du-Manoir Stadium": {"lat": 48.9292, "lon": 2.2475},  # Field hockey
+    "Teahupo'o, Tahiti": (-17.8472, -149.2667),  # Surfing (French Polynesia!)
+    "Trocadéro": (48.8616, 2.2893),  # Road cycling, marathon
+    "Vaires-sur-Marne Nautical Stadium": (48.8625, 2.6378),  # Rowing, canoe/kayak
+    "Yves-du-Manoir Stadium": (48.9292, 2.2475),  # Field hockey
     
     # Aliases / Variations found in data
-    # Sometimes the schedule data uses slightly different venue names
+    # Sometimes the schedule data uses different venue names (not just different
+    # punctuation or case, which the lookup already ignores)
     # These aliases map to the same coordinates as their parent venues
-    "La Chapelle Arena": {"lat": 48.8994, "lon": 2.3611}, # Porte de La Chapelle Arena
-    "South Paris Arena 1": {"lat": 48.8322, "lon": 2.2856},  # Different halls of South Paris Arena
-    "South Paris Arena 4": {"lat": 48.8322, "lon": 2.2856},
-    "South Paris Arena 6": {"lat": 48.8322, "lon": 2.2856},
-    "Nautical St - Flat water": {"lat": 48.8625, "lon": 2.6378}, # Vaires-sur-Marne
-    "Nautical St - White water": {"lat": 48.8625, "lon": 2.6378}, # Vaires-sur-Marne
-    "Chateauroux Shooting Ctr": {"lat": 46.8115, "lon": 1.7534},  # Abbreviated name
-    "Champ-de-Mars Arena": {"lat": 48.8530, "lon": 2.3012},  # With hyphen
-    "Roland-Garros Stadium": {"lat": 48.8473, "lon": 2.2494}  # Alternative name
+    "La Chapelle Arena": (48.8994, 2.3611), # Porte de La Chapelle Arena
+    "South Paris Arena 1": (48.8322, 2.2856),  # Different halls of South Paris Arena
+    "South Paris Arena 4": (48.8322, 2.2856),
+    "South Paris Arena 6": (48.8322, 2.2856),
+    "Nautical St - Flat water": (48.8625, 2.6378), # Vaires-sur-Marne
+    "Nautical St - White water": (48.8625, 2.6378), # Vaires-sur-Marne
+    "Chateauroux Shooting Ctr": (46.8115, 1.7534),  # Abbreviated name
+    "Roland-Garros Stadium": (48.8473, 2.2494)  # Alternative name
 }
 
+# Read-only view, so no page can modify the shared table by accident
+VENUE_COORDINATES = MappingProxyType(VENUE_COORDINATES)
+
+
+def _normalize_venue_name(venue_name):
+    """Lower-case a venue name and drop its accents and punctuation ("Trocadéro" -> "trocadero")."""
+    # NFKD splits accented letters into the letter plus a separate accent mark,
+    # which the ASCII encoding then drops
+    ascii_name = unicodedata.normalize('NFKD', venue_name).encode('ascii', 'ignore').decode()
+    # Any run of characters that aren't letters or digits becomes a single space
+    return re.sub(r'[^a-z0-9]+', ' ', ascii_name.lower()).strip()
+
+
+# The same coordinates stored as two NumPy arrays (one for all latitudes, one
+# for all longitudes) in the order of VENUE_COORDINATES, instead of one small
+# dictionary per venue. Code that needs every venue at once (e.g. for a map or
+# distance calculations) can use the arrays directly, see get_all_coords().
+_VENUE_NAMES = tuple(VENUE_COORDINATES)
+_LATS = np.fromiter((lat for lat, lon in VENUE_COORDINATES.values()), dtype=np.float64)
+_LONS = np.fromiter((lon for lat, lon in VENUE_COORDINATES.values()), dtype=np.float64)
+# Read-only, because get_all_coords() hands out these same arrays to every caller
+_LATS.flags.writeable = False
+_LONS.flags.writeable = False
+
+# The same coordinates in radians, computed once for distances_from()
+_LAT_RAD = np.radians(_LATS)
+_LON_RAD = np.radians(_LONS)
+
+# Mean radius of the Earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+# Position of each venue in the arrays, with normalized names as keys. Built once
+# when the module is imported, so each lookup only has to normalize the name it is given
+_VENUE_INDEX = {_normalize_venue_name(name): i for i, name in enumerate(_VENUE_NAMES)}
+
+# The set of words in each normalized venue name, for _find_similar_venue()
+_VENUE_WORDS = [(frozenset(name.split()), i) for name, i in _VENUE_INDEX.items()]
+
+# Short French/English words that say nothing about which venue is meant
+_STOPWORDS = frozenset({'la', 'le', 'les', 'de', 'des', 'du', 'en', 'the', 'of'})
+
+
+def _find_similar_venue(normalized_name):
+    """
+    Find a venue for a name that isn't in VENUE_COORDINATES, by comparing words.
+    
+    A venue matches when all the words of its name appear in the given name
+    ("La Concorde 1" -> "La Concorde", "Le Golf National" -> "Golf National").
+    Names with at least two meaningful words (not in _STOPWORDS) also match
+    the other way round ("BMX Stadium" -> "Saint-Quentin-en-Yvelines BMX Stadium");
+    a single word like "National" or "France" is too vague for that.
+    
+    Args:
+        normalized_name: Venue name already passed through _normalize_venue_name()
+    
+    Returns:
+        int: Position of the venue in the coordinate arrays, or None if no venue
+             matches or the matching venues are in different places
+    """
+    words = frozenset(normalized_name.split())
+    if not words:
+        return None
+    # Only allow the "all given words are in the venue name" direction when
+    # the given name says enough to identify a venue
+    allow_partial = len(words - _STOPWORDS) >= 2
+    matches = [
+        i for venue_words, i in _VENUE_WORDS
+        if venue_words <= words or (allow_partial and words <= venue_words)
+    ]
+    # Several matches are fine as long as they're all the same place
+    # (e.g. the numbered halls of South Paris Arena); otherwise it's ambiguous
+    if len({(_LATS[i], _LONS[i]) for i in matches}) != 1:
+        return None
+    return matches[0]
+
 
+# The schedule only has a few dozen different venue names, repeated over
+# thousands of events, so each name is normalized and looked up (or matched by
+# _find_similar_venue()) only once;
+# later calls with the same name return the cached (lat, lon) tuple
+@lru_cache(maxsize=256)
 def get_venue_coordinates(venue_name):
     """
     Get the geographic coordinates for a given venue name.
@@ -88,8 +177,9 @@ def get_venue_coordinates(venue_name):
     
     Args:
         venue_name: The name of the venue as it appears in the schedule data.
-                   Must match exactly (case-sensitive) to one of the keys
-                   in VENUE_COORDINATES.
+                   Case, accents and punctuation are ignored when matching
+                   it to the keys in VENUE_COORDINATES. Names that still
+                   don't match are compared word by word (see _find_similar_venue()).
     
     Returns:
         tuple: A tuple of (latitude, longitude) if the venue is found.
@@ -102,12 +192,61 @@ def get_venue_coordinates(venue_name):
         >>> get_venue_coordinates("Unknown Venue")
         None
     """
-    # Look up the venue in our dictionary
-    coords = VENUE_COORDINATES.get(venue_name)
+    # Missing venues (NaN in the schedule) can't be looked up
+    if not isinstance(venue_name, str):
+        return None
     
-    if coords:
-        # Return as a tuple (lat, lon) for easy unpacking
-        return coords['lat'], coords['lon']
+    # Look up the position of the normalized venue name
+    normalized_name = _normalize_venue_name(venue_name)
+    i = _VENUE_INDEX.get(normalized_name)
+    if i is None:
+        # Not a known spelling: try to match it to a venue by its words
+        i = _find_similar_venue(normalized_name)
+    
+    if i is not None:
+        # The table already stores a (lat, lon) tuple, ready for unpacking
+        return VENUE_COORDINATES[_VENUE_NAMES[i]]
     
     # Return None if the venue wasn't found
     return None
+
+
+def get_all_coords():
+    """
+    Get the names and coordinates of all venues as arrays.
+    
+    Use this instead of calling get_venue_coordinates() for every venue when
+    working with all of them at once (e.g., plotting every venue on a map).
+    
+    Returns:
+        tuple: (names, lats, lons) where names is a tuple of venue names and
+               lats/lons are NumPy arrays of the same length and order.
+               The arrays are shared and read-only.
+    """
+    return _VENUE_NAMES, _LATS, _LONS
+
+
+def distances_from(lat, lon):
+    """
+    Get the distance from a point to every venue, in kilometers.
+    
+    Uses the haversine formula, computed for all venues at once with NumPy
+    instead of one venue at a time.
+    
+    Args:
+        lat: Latitude of the point in decimal degrees
+        lon: Longitude of the point in decimal degrees
+    
+    Returns:
+        np.ndarray: Distances in the same order as the names from get_all_coords()
+    
+    Example:
+        >>> names, lats, lons = get_all_coords()
+        >>> names[distances_from(48.8566, 2.3522).argmin()]  # Nearest venue to Paris City Hall
+        'Hôtel de Ville'
+    """
+    lat_rad = math.radians(lat)
+    dlat = _LAT_RAD - lat_rad
+    dlon = _LON_RAD - math.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat_rad) * np.cos(_LAT_RAD) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))